@@ -1,6 +1,7 @@
 import os
 import json
 import asyncio
+import logging
 from apify import Actor
 from tender_normalizer import LLMProviderFactory, TenderNormalizer
 from tender_preprocessor import TenderPreprocessor
@@ -118,4 +119,6 @@ async def get_available_sources(supabase):
     return ["adb", "afd", "afdb", "aiib", "iadb", "sam_gov", "ted_eu", "ungm", "wb"]
 
 if __name__ == "__main__":
+    # The library modules only log; show their INFO status lines when run as the actor
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     asyncio.run(main())
@@ -1,10 +1,14 @@
 import os
 import json
+import logging
 import requests
+import threading
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional, Union
 import time
 
+logger = logging.getLogger(__name__)
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
     
@@ -97,37 +101,37 @@ Extracted data (JSON format):"""
         try:
             # Add a timeout (in seconds)
             timeout_seconds = 120 
-            print(f"DEBUG [_call_api OpenAI]: Sending request to {self.base_url} with timeout {timeout_seconds}s...") # Log before request
+            logger.debug("Sending request to %s with timeout %ss...", self.base_url, timeout_seconds) # Log before request
             response = requests.post(self.base_url, headers=self.headers, json=payload, timeout=timeout_seconds)
-            print(f"DEBUG [_call_api OpenAI]: Request finished. Status code: {response.status_code}") # Log after request
+            logger.debug("Request finished. Status code: %s", response.status_code) # Log after request
             response.raise_for_status()
-            print(f"DEBUG [_call_api OpenAI]: Parsing response JSON...") # Log before parsing
+            logger.debug("Parsing response JSON...") # Log before parsing
             content = response.json()["choices"][0]["message"]["content"]
-            print(f"DEBUG [_call_api OpenAI]: Response parsed successfully.") # Log after parsing
+            logger.debug("Response parsed successfully.") # Log after parsing
             return content
         except requests.exceptions.Timeout:
-            print(f"ERROR calling OpenAI API: Request timed out after {timeout_seconds} seconds.")
+            logger.error("Error calling OpenAI API: Request timed out after %s seconds.", timeout_seconds)
             return ""
         except requests.exceptions.RequestException as req_e:
-             print(f"ERROR calling OpenAI API: RequestException: {req_e}")
+             logger.error("Error calling OpenAI API: RequestException: %s", req_e)
              # Log response details if available
              if hasattr(req_e, 'response') and req_e.response is not None:
-                 print(f"Response status: {req_e.response.status_code}")
+                 logger.error("Response status: %s", req_e.response.status_code)
                  try:
-                     print(f"Response text: {req_e.response.text[:500]}...") # Log beginning of response text
+                     logger.error("Response text: %s...", req_e.response.text[:500]) # Log beginning of response text
                  except Exception as log_e:
-                     print(f"Could not log response text: {log_e}")
+                     logger.error("Could not log response text: %s", log_e)
              return ""
         except Exception as e:
             # Catch other potential errors like JSON parsing issues after successful request
-            print(f"ERROR calling OpenAI API or processing response: {e}")
+            logger.error("Error calling OpenAI API or processing response: %s", e)
             # Also log response status/text if available and not already logged by RequestException
             if 'response' in locals() and response is not None:
-                 print(f"Response status during error: {response.status_code}")
+                 logger.error("Response status during error: %s", response.status_code)
                  try:
-                     print(f"Response text during error: {response.text[:500]}...")
+                     logger.error("Response text during error: %s...", response.text[:500])
                  except Exception as log_e:
-                     print(f"Could not log response text during error: {log_e}")
+                     logger.error("Could not log response text during error: %s", log_e)
             return ""
 
 class GPT4oMiniProvider(LLMProvider):
@@ -204,37 +208,37 @@ Extracted data (JSON format):"""
         try:
             # Add a timeout (in seconds)
             timeout_seconds = 120 
-            print(f"DEBUG [_call_api GPT4oMini]: Sending request to {self.base_url} with timeout {timeout_seconds}s...") # Log before request
+            logger.debug("Sending request to %s with timeout %ss...", self.base_url, timeout_seconds) # Log before request
             response = requests.post(self.base_url, headers=self.headers, json=payload, timeout=timeout_seconds)
-            print(f"DEBUG [_call_api GPT4oMini]: Request finished. Status code: {response.status_code}") # Log after request
+            logger.debug("Request finished. Status code: %s", response.status_code) # Log after request
             response.raise_for_status()
-            print(f"DEBUG [_call_api GPT4oMini]: Parsing response JSON...") # Log before parsing
+            logger.debug("Parsing response JSON...") # Log before parsing
             content = response.json()["choices"][0]["message"]["content"]
-            print(f"DEBUG [_call_api GPT4oMini]: Response parsed successfully.") # Log after parsing
+            logger.debug("Response parsed successfully.") # Log after parsing
             return content
         except requests.exceptions.Timeout:
-            print(f"ERROR calling OpenAI API (GPT-4o Mini): Request timed out after {timeout_seconds} seconds.")
+            logger.error("Error calling OpenAI API (GPT-4o Mini): Request timed out after %s seconds.", timeout_seconds)
             return ""
         except requests.exceptions.RequestException as req_e:
-             print(f"ERROR calling OpenAI API (GPT-4o Mini): RequestException: {req_e}")
+             logger.error("Error calling OpenAI API (GPT-4o Mini): RequestException: %s", req_e)
              # Log response details if available
              if hasattr(req_e, 'response') and req_e.response is not None:
-                 print(f"Response status: {req_e.response.status_code}")
+                 logger.error("Response status: %s", req_e.response.status_code)
                  try:
-                     print(f"Response text: {req_e.response.text[:500]}...") # Log beginning of response text
+                     logger.error("Response text: %s...", req_e.response.text[:500]) # Log beginning of response text
                  except Exception as log_e:
-                     print(f"Could not log response text: {log_e}")
+                     logger.error("Could not log response text: %s", log_e)
              return ""
         except Exception as e:
             # Catch other potential errors like JSON parsing issues after successful request
-            print(f"ERROR calling OpenAI API (GPT-4o Mini) or processing response: {e}")
+            logger.error("Error calling OpenAI API (GPT-4o Mini) or processing response: %s", e)
             # Also log response status/text if available and not already logged by RequestException
             if 'response' in locals() and response is not None:
-                 print(f"Response status during error: {response.status_code}")
+                 logger.error("Response status during error: %s", response.status_code)
                  try:
-                     print(f"Response text during error: {response.text[:500]}...")
+                     logger.error("Response text during error: %s...", response.text[:500])
                  except Exception as log_e:
-                     print(f"Could not log response text during error: {log_e}")
+                     logger.error("Could not log response text during error: %s", log_e)
             return ""
 
 class CohereProvider(LLMProvider):
@@ -313,7 +317,7 @@ Extracted data (JSON format):"""
             response.raise_for_status()
             return response.json()["generations"][0]["text"]
         except Exception as e:
-            print(f"Error calling Cohere API: {e}")
+            logger.error("Error calling Cohere API: %s", e)
             return ""
 
 class MistralProvider(LLMProvider):
@@ -392,7 +396,7 @@ Extracted data (JSON format):"""
             response.raise_for_status()
             return response.json()["choices"][0]["message"]["content"]
         except Exception as e:
-            print(f"Error calling Mistral API: {e}")
+            logger.error("Error calling Mistral API: %s", e)
             return ""
 
 class LLMProviderFactory:
@@ -403,7 +407,7 @@ class LLMProviderFactory:
         """Create an LLM provider. 
         NOTE: This factory is currently hardcoded to ALWAYS return GPT4oMiniProvider.
         """
-        print(f"INFO: LLM Provider Factory called with type '{provider_type}'. Forcing GPT-4o Mini.")
+        logger.info("LLM Provider Factory called with type '%s'. Forcing GPT-4o Mini.", provider_type)
         # Always return GPT4oMiniProvider, ignore provider_type and model arguments
         return GPT4oMiniProvider(api_key)
 
@@ -415,6 +419,12 @@ class TenderNormalizer:
         self.cache_dir = cache_dir
         self.translation_cache = {}
         self.normalization_cache = {}
+        # Guards the caches while tenders are normalized from worker threads
+        self._cache_lock = threading.Lock()
+        # Serializes cache file writes so an older snapshot can't overwrite a newer one
+        self._save_lock = threading.Lock()
+        # Caches changed since they were last written; see save_caches
+        self._unsaved_caches = set()
         
         # Create cache directory if it doesn't exist
         os.makedirs(cache_dir, exist_ok=True)
@@ -439,59 +449,59 @@ class TenderNormalizer:
         source_schema = source_schema if isinstance(source_schema, dict) else {}
         target_schema = target_schema if isinstance(target_schema, dict) else {}
 
-        print(f"DEBUG [normalize_tender]: Starting for tender ID (from data): {tender_data.get('id', 'N/A')}")
+        logger.debug("Starting for tender ID (from data): %s", tender_data.get('id', 'N/A'))
 
         try:
             # Step 1: Construct messages for the LLM
-            print(f"DEBUG [normalize_tender]: Constructing messages...")
+            logger.debug("Constructing messages...")
             messages = self._construct_messages(tender_data, source_schema, target_schema)
             if not messages:
-                print("ERROR [normalize_tender]: Failed to construct messages.")
+                logger.error("Failed to construct messages.")
                 return None # Cannot proceed without messages
-            print(f"DEBUG [normalize_tender]: Messages constructed.")
+            logger.debug("Messages constructed.")
 
             # Step 2: Generate cache key
-            print(f"DEBUG [normalize_tender]: Generating cache key...")
+            logger.debug("Generating cache key...")
             cache_key = self._generate_cache_key(tender_data, messages)
-            print(f"DEBUG [normalize_tender]: Cache key generated: {cache_key}")
+            logger.debug("Cache key generated: %s", cache_key)
 
             # Step 3: Check cache
-            print(f"DEBUG [normalize_tender]: Checking cache...")
+            logger.debug("Checking cache...")
             cached_response = self._check_cache(cache_key)
             if cached_response:
-                print(f"DEBUG [normalize_tender]: Cache hit! Returning cached response.")
+                logger.debug("Cache hit! Returning cached response.")
                 return cached_response
-            print(f"DEBUG [normalize_tender]: Cache miss.")
+            logger.debug("Cache miss.")
 
             # Step 4: Call the LLM API (if not cached)
-            print(f"DEBUG [normalize_tender]: Calling API...")
+            logger.debug("Calling API...")
             completion = self._call_api(messages)
-            print(f"DEBUG [normalize_tender]: API call completed.") # Log added here
+            logger.debug("API call completed.") # Log added here
             
             if completion is None:
-                print("ERROR [normalize_tender]: API call failed or returned None.")
+                logger.error("API call failed or returned None.")
                 return None
 
             # Step 5: Parse the response
-            print(f"DEBUG [normalize_tender]: Parsing response...")
+            logger.debug("Parsing response...")
             normalized_tender = self._parse_response(completion)
-            print(f"DEBUG [normalize_tender]: Response parsing finished.")
+            logger.debug("Response parsing finished.")
 
             # Step 6: Update cache
             if normalized_tender:
-                print(f"DEBUG [normalize_tender]: Updating cache...")
+                logger.debug("Updating cache...")
                 self._update_cache(cache_key, normalized_tender)
-                print(f"DEBUG [normalize_tender]: Cache updated.")
+                logger.debug("Cache updated.")
             else:
-                print("WARN [normalize_tender]: Parsing failed, cache not updated.")
+                logger.warning("Parsing failed, cache not updated.")
 
-            print(f"DEBUG [normalize_tender]: Finished for tender ID: {tender_data.get('id', 'N/A')}")
+            logger.debug("Finished for tender ID: %s", tender_data.get('id', 'N/A'))
             return normalized_tender
 
         except Exception as e:
-            print(f"CRITICAL ERROR in normalize_tender for ID {tender_data.get('id', 'N/A')}: {e}")
-            import traceback
-            traceback.print_exc() # Print detailed traceback
+            logger.error("Error in normalize_tender for ID %s: %s", tender_data.get('id', 'N/A'), e)
+            # Runs once per tender; only format the traceback when debugging
+            logger.debug("Traceback for normalize_tender failure", exc_info=True)
             return None
             
     def _construct_messages(self, tender_data: Dict[str, Any], source_schema: Dict[str, Any] = None, target_schema: Dict[str, Any] = None) -> List[Dict[str, str]]:
@@ -565,7 +575,7 @@ Return ONLY the JSON object with the normalized data."""
             
             return [system_message, user_message]
         except Exception as e:
-            print(f"Error constructing messages: {e}")
+            logger.error("Error constructing messages: %s", e)
             # Return a simplified fallback message
             return [
                 {"role": "system", "content": "Normalize the tender data to match the target schema."},
@@ -598,7 +608,7 @@ Return ONLY the JSON object with the normalized data."""
         """
         try:
             # Debug logging
-            print(f"DEBUG: Parsing LLM response type: {type(completion)}")
+            logger.debug("Parsing LLM response type: %s", type(completion))
 
             # Handle different response formats based on provider
             content = None # Initialize content
@@ -614,21 +624,21 @@ Return ONLY the JSON object with the normalized data."""
                     # For Claude API that returns directly
                     content = completion['content']
                 else:
-                    print(f"Unexpected API response format: {completion}")
+                    logger.error("Unexpected API response format: %s", completion)
                     return None
             elif isinstance(completion, str):
                 # Direct string content
                 content = completion
             else:
-                print(f"Unexpected completion type: {type(completion)}")
+                logger.error("Unexpected completion type: %s", type(completion))
                 return None
 
             if not content:
-                print("Empty content in LLM response")
+                logger.error("Empty content in LLM response")
                 return None
             
             # --- Added Logging ---
-            print(f"DEBUG: Raw LLM content received (first 500 chars):\\n{content[:500]}")
+            logger.debug("Raw LLM content received (first 500 chars):\\n%s", content[:500])
             # --- End Added Logging ---
 
             # Extract JSON from the response
@@ -654,23 +664,23 @@ Return ONLY the JSON object with the normalized data."""
                      try:
                          normalized_tender = json.loads(json_str)
                          if not isinstance(normalized_tender, dict):
-                             print(f"Parsed JSON from stripped content is not a dictionary: {type(normalized_tender)}")
+                             logger.error("Parsed JSON from stripped content is not a dictionary: %s", type(normalized_tender))
                              json_str = None # Mark as failed to allow regex fallback
                              normalized_tender = None # Reset
                          else:
-                             print("DEBUG: Successfully parsed JSON after stripping fences.")
+                             logger.debug("Successfully parsed JSON after stripping fences.")
                              return normalized_tender # Success!
                      except json.JSONDecodeError as e:
-                         print(f"DEBUG: Error decoding JSON after stripping fences: {e}")
+                         logger.debug("Error decoding JSON after stripping fences: %s", e)
                          # --- Improved Logging ---
-                         print(f"DEBUG: Faulty JSON string (stripped) was: {json_str[:500]}...")
+                         logger.debug("Faulty JSON string (stripped) was: %s...", json_str[:500])
                          # --- End Improved Logging ---
                          json_str = None # Mark as failed to allow regex fallback
                          normalized_tender = None # Reset
 
                 # If stripping didn't work or failed, fall back to regex
                 if not normalized_tender: # Check if we already succeeded
-                    print("DEBUG: Falling back to regex/direct parsing for JSON extraction.")
+                    logger.debug("Falling back to regex/direct parsing for JSON extraction.")
                     json_matches = re.findall(r'```(?:json)?\\s*([\\s\\S]*?)```', content)
 
                     if json_matches:
@@ -686,7 +696,7 @@ Return ONLY the JSON object with the normalized data."""
                             if json_match:
                                 json_str = json_match.group(1).strip()
                             else:
-                                print(f"No JSON found in response (after regex/fallback): {content[:100]}...")
+                                logger.error("No JSON found in response (after regex/fallback): %s...", content[:100])
                                 return None # Give up if no JSON structure is found
 
                     # Parse the JSON found via regex or other fallbacks
@@ -694,33 +704,33 @@ Return ONLY the JSON object with the normalized data."""
                         try:
                             normalized_tender = json.loads(json_str)
                             if not isinstance(normalized_tender, dict):
-                                print(f"Parsed JSON from regex/fallback is not a dictionary: {type(normalized_tender)}")
+                                logger.error("Parsed JSON from regex/fallback is not a dictionary: %s", type(normalized_tender))
                                 return None # Fail if it's not a dict
-                            print("DEBUG: Successfully parsed JSON using regex/fallback.")
+                            logger.debug("Successfully parsed JSON using regex/fallback.")
                             return normalized_tender # Success!
                         except json.JSONDecodeError as e:
-                            print(f"Error decoding JSON (from regex/fallback): {e}")
+                            logger.error("Error decoding JSON (from regex/fallback): %s", e)
                              # --- Improved Logging ---
-                            print(f"DEBUG: Faulty JSON string (regex/fallback) was: {json_str[:500]}...")
+                            logger.debug("Faulty JSON string (regex/fallback) was: %s...", json_str[:500])
                              # --- End Improved Logging ---
                             return None # Fail parsing
                     else:
-                         print("DEBUG: Could not extract a JSON string using regex/fallback methods.")
+                         logger.debug("Could not extract a JSON string using regex/fallback methods.")
                          return None # Failed to extract any JSON string
 
             # --- Refined Exception Handling ---
             except json.JSONDecodeError as e: # Catch JSON errors specifically from the last attempt
-                print(f"FINAL PARSING ERROR: Failed to decode JSON. Error: {e}")
-                print(f"DEBUG: Final faulty JSON string attempted: {json_str[:500]}...")
+                logger.error("Final parsing error: Failed to decode JSON. Error: %s", e)
+                logger.debug("Final faulty JSON string attempted: %s...", json_str[:500])
                 return None
             except Exception as e: # Catch any other unexpected errors during parsing
-                 print(f"UNEXPECTED PARSING ERROR: An error occurred during JSON extraction/parsing: {e}")
-                 print(f"DEBUG: Original raw content was: {content[:500]}...")
+                 logger.error("Unexpected parsing error: An error occurred during JSON extraction/parsing: %s", e)
+                 logger.debug("Original raw content was: %s...", content[:500])
                  return None
             # --- End Refined Exception Handling ---
 
         except Exception as e: # Catch errors *before* parsing starts (e.g., getting content)
-            print(f"Error preparing content for LLM response parsing: {e}")
+            logger.error("Error preparing content for LLM response parsing: %s", e)
             return None
             
     def _generate_cache_key(self, tender_data: Dict[str, Any], messages: List[Dict[str, str]]) -> str:
@@ -751,7 +761,7 @@ Return ONLY the JSON object with the normalized data."""
             json_str = json.dumps(cache_data, sort_keys=True)
             return hashlib.md5(json_str.encode('utf-8')).hexdigest()
         except Exception as e:
-            print(f"Error generating cache key: {e}")
+            logger.error("Error generating cache key: %s", e)
             # Fallback to a timestamp-based key if JSON serialization fails
             import time
             return f"fallback-{int(time.time())}"
@@ -776,8 +786,9 @@ Return ONLY the JSON object with the normalized data."""
             cache_key: The cache key to update
             normalized_tender: The normalized tender data to cache
         """
-        self.normalization_cache[cache_key] = normalized_tender
-        self._save_cache("normalization")
+        with self._cache_lock:
+            self.normalization_cache[cache_key] = normalized_tender
+            self._unsaved_caches.add("normalization")
     
     def _call_api(self, messages: List[Dict[str, str]]) -> Union[Dict[str, Any], str]:
         """
@@ -790,7 +801,7 @@ Return ONLY the JSON object with the normalized data."""
             The response from the LLM API
         """
         try:
-            print(f"DEBUG [TenderNormalizer._call_api]: Delegating API call to provider {type(self.provider).__name__}") # Log before delegation
+            logger.debug("Delegating API call to provider %s", type(self.provider).__name__) # Log before delegation
             # Use the provider's API call method if it supports message format
             if hasattr(self.provider, '_call_api') and callable(getattr(self.provider, '_call_api')):
                 system_message = messages[0]['content'] if messages and messages[0]['role'] == 'system' else ""
@@ -799,13 +810,13 @@ Return ONLY the JSON object with the normalized data."""
                 # Combine system and user messages if needed
                 prompt = f"{system_message}\n\n{user_message}" if system_message else user_message
                 # Log the actual call to the provider
-                print(f"DEBUG [TenderNormalizer._call_api]: Calling {type(self.provider).__name__}._call_api(prompt)")
+                logger.debug("Calling %s._call_api(prompt)", type(self.provider).__name__)
                 result = self.provider._call_api(prompt)
-                print(f"DEBUG [TenderNormalizer._call_api]: Call to {type(self.provider).__name__}._call_api returned.") # Log after delegation returns
+                logger.debug("Call to %s._call_api returned.", type(self.provider).__name__) # Log after delegation returns
                 return result
             else:
                 # Fallback for providers without direct message support
-                print("WARN [TenderNormalizer._call_api]: Provider does not support direct API calls, using extract_structured_data instead")
+                logger.warning("Provider does not support direct API calls, using extract_structured_data instead")
                 # Extract schema from messages
                 schema = {}
                 for msg in messages:
@@ -827,14 +838,13 @@ Return ONLY the JSON object with the normalized data."""
                         break
                 
                 # Use extract_structured_data as fallback
-                print(f"DEBUG [TenderNormalizer._call_api]: Calling {type(self.provider).__name__}.extract_structured_data")
+                logger.debug("Calling %s.extract_structured_data", type(self.provider).__name__)
                 result = self.provider.extract_structured_data(tender_text, schema or {})
-                print(f"DEBUG [TenderNormalizer._call_api]: Call to {type(self.provider).__name__}.extract_structured_data returned.")
+                logger.debug("Call to %s.extract_structured_data returned.", type(self.provider).__name__)
                 return result
         except Exception as e:
-            print(f"CRITICAL ERROR in TenderNormalizer._call_api: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Error in TenderNormalizer._call_api: %s", e)
+            logger.debug("Traceback for _call_api failure", exc_info=True)
             # Return None or a dict indicating error, consistent with normalize_tender expectation
             return None 
     
@@ -849,8 +859,9 @@ Return ONLY the JSON object with the normalized data."""
         normalized_value = self.provider.normalize_field(field_name, field_value, target_schema)
         
         # Cache the result
-        self.normalization_cache[cache_key] = normalized_value
-        self._save_cache("normalization")
+        with self._cache_lock:
+            self.normalization_cache[cache_key] = normalized_value
+            self._unsaved_caches.add("normalization")
         
         return normalized_value
     
@@ -869,8 +880,9 @@ Return ONLY the JSON object with the normalized data."""
         translated_text = self.provider.translate_text(text, source_lang, target_lang)
         
         # Cache the result
-        self.translation_cache[cache_key] = translated_text
-        self._save_cache("translation")
+        with self._cache_lock:
+            self.translation_cache[cache_key] = translated_text
+            self._unsaved_caches.add("translation")
         
         return translated_text
     
@@ -930,14 +942,28 @@ Return ONLY the JSON object with the normalized data."""
                 with open(translation_cache_path, "r") as f:
                     self.translation_cache = json.load(f)
             except Exception as e:
-                print(f"Error loading translation cache: {e}")
+                logger.error("Error loading translation cache: %s", e)
         
         if os.path.exists(normalization_cache_path):
             try:
                 with open(normalization_cache_path, "r") as f:
                     self.normalization_cache = json.load(f)
             except Exception as e:
-                print(f"Error loading normalization cache: {e}")
+                logger.error("Error loading normalization cache: %s", e)
+    
+    def save_caches(self):
+        """
+        Save the caches changed since the last save to disk.
+        
+        Cache updates only mark the cache as changed; callers save once per batch
+        or at the end of a run instead of rewriting the whole file per tender.
+        """
+        with self._cache_lock:
+            cache_types = list(self._unsaved_caches)
+            self._unsaved_caches.clear()
+        
+        for cache_type in cache_types:
+            self._save_cache(cache_type)
     
     def _save_cache(self, cache_type: str):
         """Save cache to disk."""
@@ -951,10 +977,14 @@ Return ONLY the JSON object with the normalized data."""
             return
         
         try:
-            with open(cache_path, "w") as f:
-                json.dump(cache_data, f)
+            with self._save_lock:
+                # Snapshot under the cache lock; worker threads may be adding entries
+                with self._cache_lock:
+                    snapshot = dict(cache_data)
+                with open(cache_path, "w") as f:
+                    json.dump(snapshot, f)
         except Exception as e:
-            print(f"Error saving {cache_type} cache: {e}")
+            logger.error("Error saving %s cache: %s", cache_type, e)
 
 # Example usage
 if __name__ == "__main__":
@@ -1046,6 +1076,7 @@ if __name__ == "__main__":
     
     # Normalize tender data
     normalized_tender = normalizer.normalize_tender(tender_data, source_schema, target_schema)
+    normalizer.save_caches()
     
     # Print result
     print(json.dumps(normalized_tender, indent=2))
@@ -1,9 +1,12 @@
 import os
 import re
 import json
+import logging
 import datetime
 from typing import Dict, Any, List, Optional
 
+logger = logging.getLogger(__name__)
+
 class TenderPreprocessor:
     """Preprocessor for tender data before normalization."""
     
@@ -15,11 +18,12 @@ class TenderPreprocessor:
     def preprocess(self, tender_data: Dict[str, Any], source_schema: Dict[str, Any]) -> Dict[str, Any]:
         """Preprocess tender data according to source schema."""
         # Debug to track what's being passed in
-        print(f"DEBUG: Preprocessing tender with keys: {list(tender_data.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Preprocessing tender with keys: %s", list(tender_data.keys()))
         
         # Ensure tender_data is a dictionary
         if not isinstance(tender_data, dict):
-            print(f"ERROR: tender_data is not a dictionary: {type(tender_data)}")
+            logger.error("tender_data is not a dictionary: %s", type(tender_data))
             # Return a minimal valid dict to avoid errors
             return {"title": "Error: Invalid tender data type", "error": f"Expected dict, got {type(tender_data)}"}
         
@@ -28,7 +32,7 @@ class TenderPreprocessor:
         
         # Ensure source_schema is a dictionary with expected structure
         if not isinstance(source_schema, dict):
-            print(f"WARNING: source_schema is not a dictionary: {type(source_schema)}")
+            logger.warning("source_schema is not a dictionary: %s", type(source_schema))
             source_schema = {}  # Use empty dict as fallback
         
         # Process fields according to schema
@@ -92,7 +96,7 @@ class TenderPreprocessor:
     
     def _clean_data(self, data: Dict[str, Any], schema: Dict[str, Any]) -> Dict[str, Any]:
         """Clean data by handling various issues like HTML, extra whitespace, etc."""
-        print(f"DEBUG: Cleaning data with {len(schema)} schema fields")
+        logger.debug("Cleaning data with %s schema fields", len(schema))
         
         cleaned_data = data.copy()
         
@@ -174,11 +178,11 @@ class TenderPreprocessor:
                     # Format as ISO
                     processed_data[field_name] = parsed_date.strftime('%Y-%m-%d')
                 except ImportError:
-                    print("dateutil not available, using basic date processing")
+                    logger.warning("dateutil not available, using basic date processing")
                     # Basic date handling (could be enhanced)
                     processed_data[field_name] = field_value
                 except Exception as e:
-                    print(f"Error parsing date '{field_value}': {e}")
+                    logger.warning("Error parsing date '%s': %s", field_value, e)
                     # Keep original value
                     processed_data[field_name] = field_value
                     
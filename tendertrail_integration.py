@@ -1,14 +1,691 @@
 import json
 import sys
-import subprocess
 from typing import Dict, Any, List, Optional, Tuple, Union
 from supabase import create_client, Client
-import uuid
-import traceback
+from secrets import token_hex
 import re
 import datetime
 import asyncio
-from datetime import timedelta
+import functools
+import logging
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping
+from types import MappingProxyType
+from datetime import timedelta, timezone
+
+try:
+    from dateutil import parser as date_parser
+except ImportError:
+    date_parser = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Number of buffered error records that triggers a write to the 'errors' table
+ERROR_FLUSH_SIZE = 1000
+
+# Maximum error records per insert request when the buffer is flushed
+ERROR_INSERT_CHUNK = 500
+
+# Maximum characters of tender data stored with an error record
+ERROR_DATA_LIMIT = 4096
+
+# Mapping between normalized tender fields and unified_tenders columns; several
+# normalized fields may feed one column, in this order
+UNIFIED_FIELD_MAPPING = MappingProxyType({
+    "notice_title": "title",
+    "notice_type": "tender_type",
+    "issuing_authority": "issuing_authority",
+    "date_published": "date_published",
+    "closing_date": "closing_date",
+    "description": "description",
+    "location": "location",
+    "country": "location",  # Use country as fallback for location
+    "source": "source",
+    "tender_value": "tender_value",
+    "currency": "tender_currency",
+    "contact_email": "contact_information",
+    "contact_phone": "contact_information",
+    "contact_information": "contact_information",
+    "cpvs": "keywords",  # Store CPVs as keywords
+    "url": "url",  # Add URL field if exists in db
+    "buyer": "buyer",  # Add buyer field if exists in db
+    "raw_id": "raw_id",
+    "notice_id": "raw_id"  # Use notice_id as fallback for raw_id
+})
+
+# The mapping resolved once into (normalized field, column, is_text, is_date) entries
+_UNIFIED_FIELD_PLAN = tuple(
+    (norm_field, db_field, db_field in ("title", "description"), db_field in ("date_published", "closing_date"))
+    for norm_field, db_field in UNIFIED_FIELD_MAPPING.items()
+)
+
+# Rows sent per upsert request to unified_tenders; each batch is one REST round-trip
+UPSERT_BATCH_SIZE = 500
+
+# Maximum number of upsert requests in flight at once
+UPSERT_CONCURRENCY = 4
+
+# Maximum number of tenders being normalized (LLM calls in flight) at once
+NORMALIZE_CONCURRENCY = 8
+
+# Translated strings kept per integration instance, least recently used evicted first
+TRANSLATION_CACHE_SIZE = 4096
+
+# Translation requests pack several strings, up to Google's per-call character limit,
+# joined by a separator that comes back unchanged so the result can be split again
+TRANSLATION_REQUEST_CHARS = 5000
+TRANSLATION_BATCH_SIZE = 80
+
+# Maximum number of packed translation requests in flight at once; kept low for the
+# free Google endpoint's rate limit
+TRANSLATION_CONCURRENCY = 4
+_TRANSLATION_SEPARATOR = "\n\n|||\n\n"
+_TRANSLATION_SPLIT_RE = re.compile(r'\s*\|\|\|\s*')
+
+# Normalized fields whose text is translated on insert
+_TRANSLATED_FIELDS = tuple(
+    norm_field for norm_field, _db_field, is_text, _is_date in _UNIFIED_FIELD_PLAN if is_text
+)
+
+# Date handling, compiled once at import rather than on every call
+_UTC = timezone.utc
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+_ISO_SEARCH_RE = re.compile(r'(\d{4})[-/.](\d{1,2})[-/.](\d{1,2})')
+_DMY_SEARCH_RE = re.compile(r'(\d{1,2})[-/.](\d{1,2})[-/.](\d{4})')
+_DATE_FORMATS = (
+    '%Y-%m-%d', '%d-%m-%Y', '%m-%d-%Y',
+    '%Y/%m/%d', '%d/%m/%Y', '%m/%d/%Y',
+    '%d.%m.%Y', '%m.%d.%Y', '%Y.%m.%d',
+    '%b %d, %Y', '%B %d, %Y', '%d %b %Y', '%d %B %Y',
+    '%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%SZ',
+    '%a, %d %b %Y %H:%M:%S %Z'
+)
+# Formats with a single reading, which dateutil would parse the same way, picked by
+# the shape of the string so a failed strptime is rarely paid for. Numeric day/month
+# orders are left out since dateutil's month-first guess must still win.
+_SLASHED_DATE_FORMATS = ('%Y/%m/%d',)
+_DOTTED_DATE_FORMATS = ('%Y.%m.%d',)
+_DAY_FIRST_DATE_FORMATS = ('%d %B %Y', '%d %b %Y')
+_MONTH_FIRST_DATE_FORMATS = ('%B %d, %Y', '%b %d, %Y')
+
+# Common mapping from source field names to normalized field names. The keys are
+# interned because they are probed against tender dictionaries for every tender.
+_FIELD_MAPPINGS = MappingProxyType({
+    sys.intern(source_field): sys.intern(target_field)
+    for source_field, target_field in {
+        # Title
+        'title': 'notice_title',
+        'name': 'notice_title',
+        'subject': 'notice_title',
+        'noticeTitle': 'notice_title',
+        'tender_title': 'notice_title',
+
+        # Description
+        'description': 'description',
+        'details': 'description',
+        'summary': 'description',
+        'noticeDescription': 'description',
+        'text': 'description',
+        'content': 'description',
+        'body': 'description',
+
+        # Date Published
+        'date_published': 'date_published',
+        'datePublished': 'date_published',
+        'publicationDate': 'date_published',
+        'published': 'date_published',
+        'publishedDate': 'date_published',
+        'created_at': 'date_published',
+        'createdAt': 'date_published',
+        'publication_date': 'date_published',
+
+        # Closing Date
+        'closing_date': 'closing_date',
+        'closeDate': 'closing_date',
+        'deadline': 'closing_date',
+        'deadlineDate': 'closing_date',
+        'submissionDeadline': 'closing_date',
+        'expiryDate': 'closing_date',
+        'expiry_date': 'closing_date',
+        'end_date': 'closing_date',
+        'endDate': 'closing_date',
+
+        # Tender Value
+        'tender_value': 'tender_value',
+        'value': 'tender_value',
+        'amount': 'tender_value',
+        'budget': 'tender_value',
+        'estimatedValue': 'tender_value',
+        'estimated_value': 'tender_value',
+        'contractValue': 'tender_value',
+        'contract_value': 'tender_value',
+
+        # Currency
+        'currency': 'currency',
+        'currencyCode': 'currency',
+        'currency_code': 'currency',
+
+        # Location
+        'location': 'location',
+        'country': 'country',
+        'region': 'location',
+        'place': 'location',
+        'placeOfPerformance': 'location',
+        'place_of_performance': 'location',
+
+        # Issuing Authority
+        'issuing_authority': 'issuing_authority',
+        'issuingAuthority': 'issuing_authority',
+        'buyer': 'issuing_authority',
+        'agency': 'issuing_authority',
+        'organization': 'issuing_authority',
+        'authority': 'issuing_authority',
+        'contractingAuthority': 'issuing_authority',
+        'contracting_authority': 'issuing_authority',
+        'procuring_entity': 'issuing_authority',
+        'procuringEntity': 'issuing_authority',
+
+        # Tender Type
+        'tender_type': 'notice_type',
+        'type': 'notice_type',
+        'noticeType': 'notice_type',
+        'notice_type': 'notice_type',
+        'procedureType': 'notice_type',
+        'procedure_type': 'notice_type',
+
+        # Notice ID / Reference
+        'notice_id': 'notice_id',
+        'id': 'notice_id',
+        'reference': 'notice_id',
+        'referenceNumber': 'notice_id',
+        'reference_number': 'notice_id',
+        'tenderReference': 'notice_id',
+        'tender_reference': 'notice_id',
+
+        # URL
+        'url': 'url',
+        'link': 'url',
+        'tender_url': 'url',
+        'tenderUrl': 'url',
+        'noticeUrl': 'url',
+        'notice_url': 'url',
+
+        # Contact Information
+        'contact': 'contact_information',
+        'contactPerson': 'contact_information',
+        'contact_person': 'contact_information',
+        'contactEmail': 'contact_email',
+        'contact_email': 'contact_email',
+        'contactPhone': 'contact_phone',
+        'contact_phone': 'contact_phone'
+    }.items()
+})
+
+# Source fields that hold free text (cleaned of HTML) or dates (parsed to ISO)
+_TEXT_FIELDS = frozenset({'description', 'details', 'summary', 'text', 'content', 'body'})
+_DATE_FIELDS = frozenset({'date_published', 'datePublished', 'publicationDate', 'published', 
+                          'publishedDate', 'created_at', 'createdAt', 'publication_date',
+                          'closing_date', 'closeDate', 'deadline', 'deadlineDate', 
+                          'submissionDeadline', 'expiryDate', 'expiry_date', 'end_date', 'endDate'})
+
+# The mapping resolved once into (source field, target field, kind) entries, in mapping order
+_FIELD_PLAN = tuple(
+    (source_field, target_field,
+     'text' if source_field in _TEXT_FIELDS else 'date' if source_field in _DATE_FIELDS else 'copy')
+    for source_field, target_field in _FIELD_MAPPINGS.items()
+)
+
+# Source-specific fallbacks as (source field, target field, transform) entries, applied
+# after the common field mapping only when the target is still missing. A 'date'
+# transform runs the value through _parse_date.
+_SOURCE_FALLBACKS = {
+    'ungm': (('deadline', 'closing_date', 'date'), ('agency', 'issuing_authority', None)),
+    'ted_eu': (('cpvs', 'keywords', None),),
+    'wb': (('borrower', 'issuing_authority', None),),
+    'worldbank': (('borrower', 'issuing_authority', None),),
+}
+
+# Field mappings shared by the built-in default source schemas
+_COMMON_SOURCE_FIELDS = {
+    "title": {"type": "string", "maps_to": "title"},
+    "description": {"type": "string", "maps_to": "description"},
+    "notice_title": {"type": "string", "maps_to": "title"},
+    "notice_id": {"type": "string", "maps_to": "raw_id"},
+    "source": {"type": "string", "maps_to": "source"},
+    "date_published": {"type": "date", "maps_to": "date_published"},
+    "publication_date": {"type": "date", "maps_to": "date_published"},
+    "closing_date": {"type": "date", "maps_to": "closing_date"},
+    "deadline": {"type": "date", "maps_to": "closing_date"},
+    "due_date": {"type": "date", "maps_to": "closing_date"},
+    "tender_value": {"type": "monetary", "maps_to": "tender_value"},
+    "currency": {"type": "string", "maps_to": "tender_currency"},
+    "country": {"type": "string", "maps_to": "location"},
+    "location": {"type": "string", "maps_to": "location"},
+    "issuing_authority": {"type": "string", "maps_to": "issuing_authority"},
+    "notice_type": {"type": "string", "maps_to": "tender_type"},
+    "tender_type": {"type": "string", "maps_to": "tender_type"},
+    "organization": {"type": "string", "maps_to": "issuing_authority"}
+}
+
+# Default source schema fields for known sources, used when source_schemas has no row
+_DEFAULT_SOURCE_FIELDS = {
+    "adb": {
+        "title": _COMMON_SOURCE_FIELDS["title"],
+        "description": _COMMON_SOURCE_FIELDS["description"],
+        "published_date": {"type": "date", "maps_to": "date_published"},
+        "deadline": {"type": "date", "maps_to": "closing_date"},
+        "budget": {"type": "monetary", "maps_to": "tender_value"},
+        "location": _COMMON_SOURCE_FIELDS["location"],
+        "authority": {"type": "string", "maps_to": "issuing_authority"},
+        "notice_title": _COMMON_SOURCE_FIELDS["notice_title"],
+        "publication_date": _COMMON_SOURCE_FIELDS["publication_date"],
+        "due_date": _COMMON_SOURCE_FIELDS["due_date"]
+    },
+    "wb": {
+        "title": _COMMON_SOURCE_FIELDS["title"],
+        "description": _COMMON_SOURCE_FIELDS["description"],
+        "publication_date": {"type": "date", "maps_to": "date_published"},
+        "closing_date": {"type": "date", "maps_to": "closing_date"},
+        "value": {"type": "monetary", "maps_to": "tender_value"},
+        "country": {"type": "string", "maps_to": "location"},
+        "borrower": {"type": "string", "maps_to": "issuing_authority"}
+    },
+    "ungm": {
+        "title": _COMMON_SOURCE_FIELDS["title"],
+        "description": _COMMON_SOURCE_FIELDS["description"],
+        "published": {"type": "date", "maps_to": "date_published"},
+        "deadline": {"type": "date", "maps_to": "closing_date"},
+        "value": {"type": "monetary", "maps_to": "tender_value"},
+        "country": {"type": "string", "maps_to": "location"},
+        "agency": {"type": "string", "maps_to": "issuing_authority"}
+    },
+    "ted_eu": {
+        "title": _COMMON_SOURCE_FIELDS["title"],
+        "description": _COMMON_SOURCE_FIELDS["description"],
+        "publicationDate": {"type": "date", "maps_to": "date_published"},
+        "submissionDeadline": {"type": "date", "maps_to": "closing_date"},
+        "estimatedValue": {"type": "monetary", "maps_to": "tender_value"},
+        "country": {"type": "string", "maps_to": "location"},
+        "contractingAuthority": {"type": "string", "maps_to": "issuing_authority"},
+        "procedureType": {"type": "string", "maps_to": "tender_type"},
+        "cpvCodes": {"type": "array", "maps_to": "keywords"}
+    },
+    "sam_gov": {
+        "title": _COMMON_SOURCE_FIELDS["title"],
+        "description": _COMMON_SOURCE_FIELDS["description"],
+        "posted_date": {"type": "date", "maps_to": "date_published"},
+        "response_deadline": {"type": "date", "maps_to": "closing_date"},
+        "estimated_value": {"type": "monetary", "maps_to": "tender_value"},
+        "place_of_performance": {"type": "string", "maps_to": "location"},
+        "agency": {"type": "string", "maps_to": "issuing_authority"},
+        "notice_type": {"type": "string", "maps_to": "tender_type"},
+        "solicitation_number": {"type": "string", "maps_to": "raw_id"}
+    },
+    "afdb": {
+        "title": _COMMON_SOURCE_FIELDS["title"],
+        "description": _COMMON_SOURCE_FIELDS["description"],
+        "publication_date": _COMMON_SOURCE_FIELDS["publication_date"],
+        "closing_date": _COMMON_SOURCE_FIELDS["closing_date"],
+        "estimated_value": {"type": "monetary", "maps_to": "tender_value"},
+        "currency": _COMMON_SOURCE_FIELDS["currency"],
+        "country": _COMMON_SOURCE_FIELDS["country"],
+        "tender_type": _COMMON_SOURCE_FIELDS["tender_type"],
+        "sector": {"type": "string", "maps_to": "sector"}
+    }
+}
+_DEFAULT_SOURCE_FIELDS["worldbank"] = _DEFAULT_SOURCE_FIELDS["wb"]
+
+# Fields of the default schema for any other source
+_GENERIC_SOURCE_FIELDS = {
+    "title": _COMMON_SOURCE_FIELDS["title"],
+    "description": _COMMON_SOURCE_FIELDS["description"],
+    "date_published": {"type": "date", "maps_to": "date_published"},
+    "publication_date": {"type": "date", "maps_to": "date_published"},
+    "closing_date": {"type": "date", "maps_to": "closing_date"},
+    "tender_value": {"type": "monetary", "maps_to": "tender_value"},
+    "location": {"type": "string", "maps_to": "location"},
+    "country": {"type": "string", "maps_to": "location"},
+    "issuing_authority": {"type": "string", "maps_to": "issuing_authority"},
+    "notice_type": {"type": "string", "maps_to": "tender_type"},
+    "tender_type": {"type": "string", "maps_to": "tender_type"},
+    "notice_id": {"type": "string", "maps_to": "raw_id"}
+}
+
+# Target schema used when none is stored in the target_schema table
+_DEFAULT_TARGET_SCHEMA = {
+    "title": {
+        "type": "string",
+        "description": "Title of the tender",
+        "format": "Title case, max 200 characters"
+    },
+    "description": {
+        "type": "string",
+        "description": "Detailed description of the tender",
+        "format": "Plain text, max 2000 characters",
+        "requires_translation": True
+    },
+    "date_published": {
+        "type": "string",
+        "description": "Date when the tender was published",
+        "format": "ISO 8601 (YYYY-MM-DD)"
+    },
+    "closing_date": {
+        "type": "string",
+        "description": "Deadline for tender submissions",
+        "format": "ISO 8601 (YYYY-MM-DD)"
+    },
+    "tender_value": {
+        "type": "string",
+        "description": "Estimated value of the tender",
+        "format": "Numeric value followed by currency code (e.g., 1000000 USD)"
+    },
+    "tender_currency": {
+        "type": "string",
+        "description": "Currency of the tender value",
+        "format": "ISO 4217 currency code (e.g., USD, EUR)",
+        "extract_from": {
+            "field": "tender_value"
+        }
+    },
+    "location": {
+        "type": "string",
+        "description": "Location where the project will be implemented",
+        "format": "City, Country"
+    },
+    "issuing_authority": {
+        "type": "string",
+        "description": "Organization issuing the tender",
+        "format": "Official organization name"
+    },
+    "tender_type": {
+        "type": "string",
+        "description": "Type of tender",
+        "format": "One of: Goods, Works, Services, Consulting",
+        "extract_from": {
+            "field": "description"
+        }
+    },
+    "raw_id": {
+        "type": "string",
+        "description": "Original ID from the source system",
+        "format": "As provided by source"
+    },
+    "source": {
+        "type": "string",
+        "description": "Source of the tender",
+        "format": "Short code for the source (e.g., adb, wb, ted_eu)"
+    },
+    "language": "en"
+}
+
+def _truncated_json(value, limit):
+    """Serialize value to JSON and cut the result to at most limit characters."""
+    if orjson is not None:
+        # orjson encodes in C straight to bytes; drop any character split by the cut
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)[:limit].decode('utf-8', 'ignore')
+    return json.dumps(value)[:limit]
+
+def _json_loads(text):
+    """Parse a JSON document from str or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # Let the stdlib decide: it also accepts NaN/Infinity and big integers,
+            # and raises the usual json.JSONDecodeError otherwise
+            pass
+    return json.loads(text)
+
+def _json_dumps(value):
+    """Serialize value to a JSON string, falling back to str() for unknown types."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(value, default=str)
+
+def _error_data(value):
+    """Serialize value for an error record, cut to at most ERROR_DATA_LIMIT characters."""
+    text = _json_dumps(value)
+    if len(text) > ERROR_DATA_LIMIT:
+        return text[:ERROR_DATA_LIMIT] + "... [truncated]"
+    return text
+
+def _dict_from_json_text(text):
+    """Parse a JSON string into a tender dict, wrapping anything that is not an object."""
+    try:
+        parsed = _json_loads(text)
+    except Exception:
+        # For strings that aren't JSON, create a simple container
+        return {"text": text, "id": "unknown"}
+    if isinstance(parsed, dict):
+        return parsed
+    if isinstance(parsed, list) and parsed and isinstance(parsed[0], dict):
+        # If it's a list with dict as first item, return that
+        return parsed[0]
+    # Create a simple wrapper dict for the parsed data
+    return {"data": parsed, "id": "unknown"}
+
+def _dict_from_list(items):
+    """Return the first item of a list as a tender dict, or None if it is not one."""
+    if items:
+        first = items[0]
+        if isinstance(first, dict):
+            return first
+        # Try to parse first item if it's a string
+        if isinstance(first, str):
+            try:
+                parsed = _json_loads(first)
+            except Exception:
+                return None
+            if isinstance(parsed, dict):
+                return parsed
+    return None
+
+# Converters for the common tender container types, looked up by exact type
+_DICT_CONVERTERS = {
+    dict: lambda data: data,
+    str: _dict_from_json_text,
+    list: _dict_from_list,
+}
+
+def _pack_translation_requests(texts):
+    """Group texts into requests of at most TRANSLATION_BATCH_SIZE items and TRANSLATION_REQUEST_CHARS characters."""
+    requests, current, size = [], [], 0
+    for text in texts:
+        if len(text) > TRANSLATION_REQUEST_CHARS or '|||' in text:
+            # Too long for any request, or would split apart on the way back; left
+            # to the single-string path
+            continue
+        added = len(text) + (len(_TRANSLATION_SEPARATOR) if current else 0)
+        if current and (size + added > TRANSLATION_REQUEST_CHARS or len(current) >= TRANSLATION_BATCH_SIZE):
+            requests.append(current)
+            current, size, added = [], 0, len(text)
+        current.append(text)
+        size += added
+    if current:
+        requests.append(current)
+    return requests
+
+def _translate_joined(translator, texts):
+    """Translate texts in one request and return the translations in order.
+    
+    If the result doesn't split back into one piece per text (the translator dropped or
+    rewrote a separator), each text is translated on its own instead, so no translation
+    can shift onto another text.
+    """
+    translated = translator.translate(_TRANSLATION_SEPARATOR.join(texts))
+    if translated:
+        parts = _TRANSLATION_SPLIT_RE.split(translated.strip())
+        if len(parts) == len(texts) and all(parts):
+            return parts
+    logger.debug("Packed translation of %s strings did not split back; using single requests", len(texts))
+    return [translator.translate(text) for text in texts]
+
+def _parse_date_text(date_str):
+    """Parse a non-numeric date value into ISO format (YYYY-MM-DD), or None."""
+    # If already ISO format, return as is
+    if isinstance(date_str, str) and len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        return date_str
+
+    # ISO 8601 timestamps are by far the most common input; the C parser handles them.
+    # Week dates (2023-W02) are left out, since the rest of the cascade rejects them.
+    try:
+        if 'W' not in date_str:
+            return datetime.datetime.fromisoformat(date_str).strftime('%Y-%m-%d')
+    except (TypeError, ValueError):
+        pass
+
+    # Unambiguous formats parse far faster with strptime than with dateutil
+    if not isinstance(date_str, str):
+        formats = ()
+    elif '/' in date_str:
+        formats = _SLASHED_DATE_FORMATS
+    elif '.' in date_str:
+        formats = _DOTTED_DATE_FORMATS
+    elif date_str[:1].isdigit():
+        formats = _DAY_FIRST_DATE_FORMATS
+    else:
+        formats = _MONTH_FIRST_DATE_FORMATS
+    for fmt in formats:
+        try:
+            return datetime.datetime.strptime(date_str, fmt).strftime('%Y-%m-%d')
+        except (TypeError, ValueError):
+            continue
+
+    # Try to parse with dateutil
+    if date_parser is not None:
+        try:
+            parsed_date = date_parser.parse(date_str)
+            return parsed_date.strftime('%Y-%m-%d')
+        except Exception as e:
+            logger.debug("Error parsing date with dateutil: %s", e)
+    else:
+        logger.warning("dateutil not installed, using basic date parsing")
+
+    # Fallback to basic parsing
+    try:
+        # Try common formats
+        for fmt in _DATE_FORMATS:
+            try:
+                parsed_date = datetime.datetime.strptime(date_str, fmt)
+                return parsed_date.strftime('%Y-%m-%d')
+            except ValueError:
+                continue
+
+        # If none of the formats worked, try to extract date with regex
+        # Pattern for YYYY-MM-DD or similar
+        iso_match = _ISO_SEARCH_RE.search(date_str)
+        if iso_match:
+            year, month, day = iso_match.groups()
+            return f"{year}-{int(month):02d}-{int(day):02d}"
+
+        # Pattern for DD-MM-YYYY or similar
+        dmy_match = _DMY_SEARCH_RE.search(date_str)
+        if dmy_match:
+            day, month, year = dmy_match.groups()
+            return f"{year}-{int(month):02d}-{int(day):02d}"
+
+        # If all else fails, return None
+        return None
+    except Exception as e:
+        logger.error("Error in basic date parsing: %s", e)
+        return None
+
+# Memoized variant used for str inputs; the size bounds memory on long-running workers
+_parse_date_text_cached = functools.lru_cache(maxsize=8192)(_parse_date_text)
+
+@functools.lru_cache(maxsize=4096)
+def _is_iso_date_text(date_str):
+    """Check a date string is ISO (YYYY-MM-DD) with plausible ranges; memoized per string."""
+    match = _ISO_DATE_RE.fullmatch(date_str)
+    if match is None:
+        return False
+    year, month, day = match.groups()
+    return 1900 <= int(year) <= 2100 and 1 <= int(month) <= 12 and 1 <= int(day) <= 31
+
+# Sentinel for dict lookups where a stored None must still count as present
+_MISSING = object()
+
+def _jsonb_value(value):
+    """Return value as plain JSON data for a JSONB column, with unknown types as their str() form."""
+    try:
+        return _json_loads(_json_dumps(value))
+    except (TypeError, ValueError) as e:
+        logger.error("Error serializing metadata to JSON: %s", e)
+        return str(value) # Fallback
+
+# Normalized fields drawn from small vocabularies; their values are interned so a
+# large batch holds one string object per distinct value
+_INTERNED_FIELDS = ('currency', 'country', 'notice_type', 'issuing_authority', 'source', 'language')
+
+# Currency symbols recognised in combined tender value strings
+_CURRENCY_SYMBOLS = {'$': 'USD', '€': 'EUR', '£': 'GBP', '¥': 'JPY'}
+
+# Currency code or symbol in a combined value string, and the characters stripped
+# from it to leave the number
+_CURRENCY_RE = re.compile(r'([A-Z]{3}|\$|€|£|¥)')
+_NUMERIC_STRIP_RE = re.compile(r'[^\d.]')
+
+# Basic HTML cleaning when BeautifulSoup is not installed
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Field names an LLM normalizer may return in place of the integration's own, as
+# (llm field, integration field). Fields both sides name alike need no entry.
+_LLM_FIELD_ALIASES = (
+    ('title', 'notice_title'),
+    ('tender_currency', 'currency'),
+)
+
+# The same plan keyed by source field, as (target field, kind, rank). When several
+# source fields map to one target, the one later in the mapping (higher rank) wins.
+_FIELD_RULES = MappingProxyType({
+    source_field: (target_field, kind, rank)
+    for rank, (source_field, target_field, kind) in enumerate(_FIELD_PLAN)
+})
+
+# Supabase clients keyed by (url, key), shared so every integration instance in the
+# process reuses the same HTTP connection pool instead of opening its own
+_SUPABASE_CLIENTS = {}
+
+# Tables confirmed to exist, per (url, key), so each check runs once per process
+_READY_TABLES = {}
+
+# Seconds an idle Supabase connection stays open. Long enough to bridge the gap
+# between batches while tenders are being normalized, so requests skip the TLS handshake
+SUPABASE_KEEPALIVE_EXPIRY = 60.0
+
+def _supabase_client_options():
+    """Client options with a keep-alive HTTP/2 connection pool, or None if unsupported."""
+    try:
+        import httpx
+        from supabase import ClientOptions
+        http_client = httpx.Client(
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=40,
+                keepalive_expiry=SUPABASE_KEEPALIVE_EXPIRY,
+            ),
+            # Same overall budget as the client's default REST timeout
+            timeout=httpx.Timeout(120.0, connect=10.0),
+            # As the stock REST client: concurrent requests share one connection as
+            # HTTP/2 streams instead of each waiting for a connection of its own
+            http2=True,
+            follow_redirects=True,
+        )
+        return ClientOptions(httpx_client=http_client)
+    except (ImportError, TypeError):
+        # Older supabase releases without custom HTTP clients, or httpx without h2
+        return None
 
 class TenderTrailIntegration:
     """Integration layer for TenderTrail normalization workflow."""
@@ -30,25 +707,57 @@ class TenderTrailIntegration:
         if supabase_url and supabase_key:
             try:
                 from supabase import create_client
-                self.supabase = create_client(supabase_url, supabase_key) # Moved inside try
-                print("Successfully initialized Supabase client") # Moved inside try
+                client_key = (supabase_url, supabase_key)
+                if client_key in _SUPABASE_CLIENTS:
+                    self.supabase = _SUPABASE_CLIENTS[client_key]
+                    logger.debug("Reusing existing Supabase client")
+                else:
+                    options = _supabase_client_options()
+                    if options is not None:
+                        self.supabase = create_client(supabase_url, supabase_key, options=options)
+                    else:
+                        self.supabase = create_client(supabase_url, supabase_key)
+                    _SUPABASE_CLIENTS[client_key] = self.supabase
+                    logger.info("Successfully initialized Supabase client") # Moved inside try
             except ImportError: # Correctly aligned with try
-                print("Supabase client library not found. Run: pip install supabase")
-                print("Disabling Supabase functionality.")
+                logger.error("Supabase client library not found. Run: pip install supabase")
+                logger.warning("Disabling Supabase functionality.")
                 self.supabase = None # Set to None on import error
             except Exception as e: # Correctly aligned with try
-                print(f"Error initializing Supabase client: {e}")
-                print("Disabling Supabase functionality.")
+                logger.error("Error initializing Supabase client: %s", e)
+                logger.warning("Disabling Supabase functionality.")
                 self.supabase = None # Set to None on other init errors
         else:
-            print("Supabase URL or key not provided. Disabling Supabase functionality.")
+            logger.warning("Supabase URL or key not provided. Disabling Supabase functionality.")
             self.supabase = None # Ensure supabase is set to None if not initialized
         
-        # Initialize translation cache
-        self.translation_cache = {}
+        # Initialize translation cache (bounded LRU: original text -> translation)
+        self.translation_cache = OrderedDict()
         
         # Initialize schema cache
         self.target_schema = None
+        
+        # Table existence checks run lazily on the first insert, not at construction
+        self._ensured_tables = False
+        
+        # Names of tables confirmed to exist, so later checks skip the round-trip;
+        # shared by every instance talking to the same Supabase project
+        if self.supabase is not None:
+            self._ready_tables = _READY_TABLES.setdefault((supabase_url, supabase_key), set())
+        else:
+            self._ready_tables = set()
+        
+        # Source being run by process_source; error records fall back to "unknown" without one
+        self._current_source = None
+        
+        # Error records waiting to be written to the 'errors' table
+        self._error_buffer = []
+        
+        # Rule-based normalizers specialized per source, built on first use
+        self._compiled_norms = {}
+        
+        # Source schemas already resolved, keyed by source name
+        self._source_schemas = {}
     
     async def process_source(self, tenders_or_source, source_name_or_batch_size=None, create_tables=True):
         """
@@ -69,18 +778,18 @@ class TenderTrailIntegration:
             tenders = tenders_or_source
             source_name = source_name_or_batch_size
             batch_size = None
-            print(f"DEBUG: Using first pattern - direct tenders list with source_name='{source_name}'")
+            logger.debug("Using first pattern - direct tenders list with source_name='%s'", source_name)
         else:
             # Second pattern: process_source(source_name, batch_size)
             source_name = tenders_or_source
             batch_size = 100  # Default
             if source_name_or_batch_size is not None and isinstance(source_name_or_batch_size, int):
                 batch_size = source_name_or_batch_size
-            print(f"DEBUG: Using second pattern - source_name='{source_name}' with batch_size={batch_size}")
+            logger.debug("Using second pattern - source_name='%s' with batch_size=%s", source_name, batch_size)
             # Get tenders from database
             tenders = await self._get_raw_tenders(source_name, batch_size)
         
-        print(f"Processing {len(tenders) if isinstance(tenders, (list, tuple)) else 'unknown number of'} tenders from source: {source_name}")
+        logger.info("Processing %s tenders from source: %s", len(tenders) if isinstance(tenders, (list, tuple)) else 'unknown number of', source_name)
         
         processed_count = 0
         error_count = 0
@@ -97,19 +806,19 @@ class TenderTrailIntegration:
             
             # Insert all normalized tenders into the database
             if normalized_tenders:
-                inserted_count = await self._insert_normalized_tenders(normalized_tenders, create_tables)
-                print(f"Inserted {inserted_count} tenders from source: {source_name}")
+                inserted_count, duplicate_count = await self._insert_normalized_tenders(normalized_tenders, create_tables)
+                logger.info("Inserted %s tenders from source: %s", inserted_count, source_name)
                 
-                # Calculate error count based on insertion success
-                error_count = processed_count - inserted_count
+                # Calculate error count based on insertion success; tenders replaced by a
+                # later one with the same key were stored through that one, not lost
+                error_count = processed_count - inserted_count - duplicate_count
             else:
-                print(f"No tenders were successfully normalized for source: {source_name}")
+                logger.info("No tenders were successfully normalized for source: %s", source_name)
                 error_count = len(tenders) # All original tenders failed if none were normalized
                 
         # Correctly aligned and structured except block
         except Exception as e: 
-            print(f"Error processing source {source_name}: {e}") 
-            traceback.print_exc()
+            logger.exception("Error processing source %s: %s", source_name, e)
             error_count = len(tenders) # Assume all failed if main processing block crashed
             processed_count = 0
             inserted_count = 0
@@ -133,13 +842,13 @@ class TenderTrailIntegration:
             Tuple (processed_count, error_count)
         """
         try:
-            print(f"Processing JSON data for source: {source_name}")
+            logger.info("Processing JSON data for source: %s", source_name)
             
             # Handle different input structures
             tenders = []
             if isinstance(json_data, list):
                 tenders = json_data
-                print(f"Found {len(tenders)} tenders in list format")
+                logger.info("Found %s tenders in list format", len(tenders))
             elif isinstance(json_data, dict):
                 # Try to find a list in the dictionary
                 list_found = False
@@ -147,81 +856,74 @@ class TenderTrailIntegration:
                     if isinstance(value, list) and value:
                         tenders = value
                         list_found = True
-                        print(f"Found {len(tenders)} tenders in dictionary key: '{key}'")
+                        logger.info("Found %s tenders in dictionary key: '%s'", len(tenders), key)
                         break
                 
                 if not list_found and "data" in json_data and json_data["data"]:
                     if isinstance(json_data["data"], list):
                         tenders = json_data["data"]
-                        print(f"Found {len(tenders)} tenders in 'data' field")
+                        logger.info("Found %s tenders in 'data' field", len(tenders))
                     else:
                         tenders = [json_data["data"]]
-                        print("Using 'data' field as a single tender")
+                        logger.info("Using 'data' field as a single tender")
             else:
-                print(f"Unsupported JSON data type: {type(json_data)}")
-                print("Expected a list of tenders or a dictionary containing a list of tenders")
+                logger.warning("Unsupported JSON data type: %s", type(json_data))
+                logger.warning("Expected a list of tenders or a dictionary containing a list of tenders")
                 return 0, 0
             
             # Process the tenders
             if not tenders:
-                print(f"No tenders found for source: {source_name}")
+                logger.info("No tenders found for source: %s", source_name)
                 return 0, 0
             
-            print(f"Processing {len(tenders)} tenders for source: {source_name}")
+            logger.info("Processing %s tenders for source: %s", len(tenders), source_name)
             
             # Show a preview of the first tender for debugging
             try:
-                if tenders and len(tenders) > 0:
-                    first_tender = tenders[0]
-                    preview = str(first_tender)[:500] + "..." if len(str(first_tender)) > 500 else str(first_tender)
-                    print(f"First tender preview: {preview}")
+                if tenders and logger.isEnabledFor(logging.DEBUG):
+                    preview = str(tenders[0])
+                    if len(preview) > 500:
+                        preview = preview[:500] + "..."
+                    logger.debug("First tender preview: %s", preview)
             except Exception as preview_e:
-                print(f"Could not preview first tender: {preview_e}")
+                logger.debug("Could not preview first tender: %s", preview_e)
             
             return self.process_source(tenders, source_name)
                 
         except Exception as e: # Corrected indentation
-            print(f"Error processing JSON data for source {source_name}: {e}")
-            traceback.print_exc()
+            logger.exception("Error processing JSON data for source %s: %s", source_name, e)
             return 0, 0
     
     def _ensure_dict(self, data: Any) -> Dict[str, Any]:
         """Ensure that data is a dictionary."""
-        # Add more debugging
-        print(f"Ensuring dictionary for data of type: {type(data)}")
+        # Plain dicts are the common case; return them before any logging
+        if type(data) is dict:
+            return data
         
-        # Check for dict directly first
-        if isinstance(data, dict):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Ensuring dictionary for data of type: %s", type(data))
+        
+        converter = _DICT_CONVERTERS.get(type(data))
+        if converter is not None:
+            result = converter(data)
+            if result is not None:
+                return result
+        # Subclasses of the dispatched types take the same conversions
+        elif isinstance(data, dict):
             return data
+        elif isinstance(data, str):
+            return _dict_from_json_text(data)
+        elif isinstance(data, list):
+            result = _dict_from_list(data)
+            if result is not None:
+                return result
         
-        # Handle string case
-        if isinstance(data, str):
+        # Mapping types (e.g. record proxies) convert in a single call
+        if isinstance(data, Mapping):
             try:
-                parsed = json.loads(data)
-                if isinstance(parsed, dict):
-                    return parsed
-                elif isinstance(parsed, list) and len(parsed) > 0 and isinstance(parsed[0], dict):
-                    # If it's a list with dict as first item, return that
-                    return parsed[0]
-                else:
-                    # Create a simple wrapper dict for the parsed data
-                    return {"data": parsed, "id": "unknown"}
-            except Exception as e:
-                # For strings that aren't JSON, create a simple container
-                return {"text": data, "id": "unknown"}
-        
-        # Handle list case
-        if isinstance(data, list) and len(data) > 0:
-            if isinstance(data[0], dict):
-                return data[0]
-            # Try to parse first item if it's a string
-            elif isinstance(data[0], str):
-                try:
-                    parsed = json.loads(data[0])
-                    if isinstance(parsed, dict):
-                        return parsed
-                except:
-                    pass
+                return dict(data)
+            except TypeError:
+                pass
         
         # Check for common object patterns with get methods
         if hasattr(data, 'get') and callable(data.get):
@@ -249,7 +951,7 @@ class TenderTrailIntegration:
                     return data_field
                 elif isinstance(data_field, str):
                     try:
-                        parsed = json.loads(data_field)
+                        parsed = _json_loads(data_field)
                         if isinstance(parsed, dict):
                             return parsed
                     except:
@@ -258,7 +960,7 @@ class TenderTrailIntegration:
                 pass
         
         # Last resort: create a basic placeholder dict
-        print(f"Unable to convert {type(data)} to dictionary, creating placeholder")
+        logger.warning("Unable to convert %s to dictionary, creating placeholder", type(data))
         return {
             "id": str(id(data)),
             "error": f"Unable to convert {type(data)} to proper dictionary",
@@ -274,7 +976,7 @@ class TenderTrailIntegration:
         # Handle JSON string
         if isinstance(tender, str):
             try:
-                parsed = json.loads(tender)
+                parsed = _json_loads(tender)
                 if isinstance(parsed, dict):
                     return parsed.get('id', default_id)
             except:
@@ -300,9 +1002,13 @@ class TenderTrailIntegration:
             The schema for the source
         """
         if not source_name:
-            print("No source name provided, using default schema")
+            logger.info("No source name provided, using default schema")
             return self._get_default_source_schema(None)
         
+        schema = self._source_schemas.get(source_name)
+        if schema is not None:
+            return schema
+        
         # Try to get the schema from the database
         try:
             loop = asyncio.get_event_loop()
@@ -315,20 +1021,24 @@ class TenderTrailIntegration:
             )
             
             if result and hasattr(result, 'data') and result.data and len(result.data) > 0:
-                print(f"DEBUG: Found schema for '{source_name}' in database.")
+                logger.debug("Found schema for '%s' in database.", source_name)
                 db_schema = result.data[0]['schema']
                 
                 # Wrap the schema in a 'fields' key for compatibility with TenderPreprocessor
                 # The TenderPreprocessor expects: {'fields': {field1: {...}, field2: {...}, ...}}
                 schema = {'fields': db_schema}
+                self._source_schemas[source_name] = schema
                 return schema
         except Exception as e:
-            print(f"Error getting schema for '{source_name}' from database: {e}")
+            # Not cached, so the next batch retries the lookup
+            logger.error("Error getting schema for '%s' from database: %s", source_name, e)
+            return self._get_default_source_schema(source_name)
         
-        # If we get here, either the database query failed or no schema was found
-        print(f"No schema found for '{source_name}', using default schema")
-        # Correctly indented return statement
-        return self._get_default_source_schema(source_name) 
+        # If we get here, no schema was found for this source
+        logger.info("No schema found for '%s', using default schema", source_name)
+        schema = self._get_default_source_schema(source_name)
+        self._source_schemas[source_name] = schema
+        return schema
     
     async def _get_target_schema(self):
         """
@@ -350,80 +1060,29 @@ class TenderTrailIntegration:
             if hasattr(response, 'data') and response.data and len(response.data) > 0:
                 schema = response.data[0].get('schema')
                 if schema:
-                    print("DEBUG: Found target schema in database")
+                    logger.debug("Found target schema in database")
                     if isinstance(schema, str):
-                        return json.loads(schema)
+                        return _json_loads(schema)
                     elif isinstance(schema, dict):
                         return schema
         except Exception as e:
-            print(f"Error retrieving target schema from database: {e}")
+            logger.error("Error retrieving target schema from database: %s", e)
     
         # Fallback to default schema
-        print("Using default target schema")
+        logger.info("Using default target schema")
+        return self._get_default_target_schema()
+    
+    def _get_default_target_schema(self):
+        """
+        Get the built-in target schema.
+        
+        Returns:
+            Dictionary representing the default target schema
+        """
+        # Copy the field specs so callers can adjust them without touching the shared default
         return {
-            "title": {
-                "type": "string",
-                "description": "Title of the tender",
-                "format": "Title case, max 200 characters"
-            },
-            "description": {
-                "type": "string",
-                "description": "Detailed description of the tender",
-                "format": "Plain text, max 2000 characters",
-                "requires_translation": True
-            },
-            "date_published": {
-                "type": "string",
-                "description": "Date when the tender was published",
-                "format": "ISO 8601 (YYYY-MM-DD)"
-            },
-            "closing_date": {
-                "type": "string",
-                "description": "Deadline for tender submissions",
-                "format": "ISO 8601 (YYYY-MM-DD)"
-            },
-            "tender_value": {
-                "type": "string",
-                "description": "Estimated value of the tender",
-                "format": "Numeric value followed by currency code (e.g., 1000000 USD)"
-            },
-            "tender_currency": {
-                "type": "string",
-                "description": "Currency of the tender value",
-                "format": "ISO 4217 currency code (e.g., USD, EUR)",
-                "extract_from": {
-                    "field": "tender_value"
-                }
-            },
-            "location": {
-                "type": "string",
-                "description": "Location where the project will be implemented",
-                "format": "City, Country"
-            },
-            "issuing_authority": {
-                "type": "string",
-                "description": "Organization issuing the tender",
-                "format": "Official organization name"
-            },
-            "tender_type": {
-                "type": "string",
-                "description": "Type of tender",
-                "format": "One of: Goods, Works, Services, Consulting",
-                "extract_from": {
-                    "field": "description"
-                }
-            },
-            "raw_id": {
-                "type": "string",
-                "description": "Original ID from the source system",
-                "format": "As provided by source"
-            },
-            "source": {
-                "type": "string",
-                "description": "Source of the tender",
-                "format": "Short code for the source (e.g., adb, wb, ted_eu)"
-            },
-            "language": "en"
+            field: dict(spec) if isinstance(spec, dict) else spec
+            for field, spec in _DEFAULT_TARGET_SCHEMA.items()
         }
     
     async def _create_target_schema_table(self) -> None:
@@ -440,12 +1099,12 @@ class TenderTrailIntegration:
                 )
                 
                 if hasattr(response, 'data'):
-                    print("target_schema table already exists")
+                    logger.debug("target_schema table already exists")
                     
                     # If the table exists but is empty, try to populate it
                     if not response.data:
                         try: # Innermost try block
-                            print("Adding default schema to empty target_schema table")
+                            logger.info("Adding default schema to empty target_schema table")
                             default_schema = self._get_default_target_schema()
                             
                             # Insert using run_in_executor
@@ -456,9 +1115,9 @@ class TenderTrailIntegration:
                                 }).execute()
                             )
                             
-                            print("Successfully added default schema to target_schema")
+                            logger.info("Successfully added default schema to target_schema")
                         except Exception as e: # Matches innermost try
-                            print(f"Error adding default schema: {e}")
+                            logger.error("Error adding default schema: %s", e)
                     
                     return # Exit if table exists (and potentially populated)
                 
@@ -466,16 +1125,16 @@ class TenderTrailIntegration:
             except Exception as inner_e:
                 # If the error indicates the table doesn't exist, log it nicely
                 if "relation" in str(inner_e).lower() and "does not exist" in str(inner_e).lower():
-                    print(f"target_schema table check confirms: table does not exist.")
+                    logger.warning("target_schema table check confirms: table does not exist.")
                 else:
                     # Log other errors encountered during the check
-                    print(f"Error during target_schema existence check: {inner_e}")
+                    logger.error("Error during target_schema existence check: %s", inner_e)
                 # Allow execution to continue to the manual creation info block
 
             # If check failed or table doesn't exist, inform user about manual creation
-            print("Cannot create target_schema table directly via client library.")
-            print("Please ensure the table exists or create it using the Supabase UI or SQL Editor with this schema:")
-            print("""
+            logger.warning("Cannot create target_schema table directly via client library.")
+            logger.warning("Please ensure the table exists or create it using the Supabase UI or SQL Editor with this schema:")
+            logger.warning("""
             CREATE TABLE IF NOT EXISTS public.target_schema (
                 id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
                 schema JSONB NOT NULL,
@@ -485,17 +1144,17 @@ class TenderTrailIntegration:
             """)
             
             # We'll continue with the in-memory default schema if creation/check fails
-            print("Using in-memory default schema as fallback.")
+            logger.info("Using in-memory default schema as fallback.")
             
         # This except matches the OUTER try
         except Exception as general_e:
-            print(f"General error in _create_target_schema_table: {general_e}")
-            print("Continuing with in-memory schema as fallback.")
+            logger.warning("General error in _create_target_schema_table: %s", general_e)
+            logger.info("Continuing with in-memory schema as fallback.")
     
     async def _get_raw_tenders(self, source_name: str, batch_size: int) -> List[Dict[str, Any]]:
         """Get raw tenders from the database for a source."""
         try:
-            print(f"DEBUG: Fetching tenders from source table: {source_name}")
+            logger.debug("Fetching tenders from source table: %s", source_name)
             
             # Use run_in_executor to run Supabase client calls asynchronously
             loop = asyncio.get_event_loop()
@@ -510,7 +1169,7 @@ class TenderTrailIntegration:
             # Check if the response contains data
             if hasattr(response, 'data'):
                 raw_tenders = response.data
-                print(f"DEBUG: Fetched {len(raw_tenders)} tenders from {source_name}")
+                logger.debug("Fetched %s tenders from %s", len(raw_tenders), source_name)
                 
                 # Basic data validation and cleaning for robustness
                 processed_tenders = []
@@ -527,7 +1186,7 @@ class TenderTrailIntegration:
                         # If it's a string, try to parse it as JSON
                         if isinstance(item, str):
                             try:
-                                parsed = json.loads(item)
+                                parsed = _json_loads(item)
                                 if isinstance(parsed, dict):
                                     if 'source' not in parsed:
                                         parsed['source'] = source_name
@@ -538,7 +1197,7 @@ class TenderTrailIntegration:
                                 processed_tenders.append({
                                     'content': item,
                                     'source': source_name,
-                                    'id': str(uuid.uuid4())
+                                    'id': token_hex(16)
                                 })
                                 continue
                         
@@ -567,36 +1226,40 @@ class TenderTrailIntegration:
                         processed_tenders.append({
                             'data': str(item),
                             'source': source_name,
-                            'id': str(uuid.uuid4())
+                            'id': token_hex(16)
                         })
                         
                     except Exception as item_e:
-                        print(f"Error processing tender item: {item_e}")
+                        logger.error("Error processing tender item: %s", item_e)
                         # Still include it as a wrapped error item for visibility
                         processed_tenders.append({
                             'error': str(item_e),
                             'source': source_name,
-                            'id': str(uuid.uuid4())
+                            'id': token_hex(16)
                         })
                 
                 return processed_tenders
             else:
-                print(f"No data found for source {source_name}")
+                logger.info("No data found for source %s", source_name)
                 return []
         except Exception as e:
-            print(f"Error getting raw tenders from database: {e}")
-            print(f"Table {source_name} may not exist or may not be accessible")
+            logger.error("Error getting raw tenders from database: %s", e)
+            logger.warning("Table %s may not exist or may not be accessible", source_name)
             return []
     
     def _process_raw_tenders(self, raw_data: List[Any]) -> List[Dict[str, Any]]:
         """Process raw tenders data to ensure all items are dictionaries."""
+        # Fast path: Supabase normally returns a clean list of dicts
+        if all(type(item) is dict for item in raw_data):
+            return list(raw_data)
+        
         processed_tenders = []
         
         # Extra debugging to understand the data format
         sample_item = raw_data[0] if raw_data else None
-        print(f"Sample raw tender type: {type(sample_item)}")
+        logger.debug("Sample raw tender type: %s", type(sample_item))
         if sample_item:
-            print(f"Sample raw tender preview: {str(sample_item)[:200]}")
+            logger.debug("Sample raw tender preview: %s", str(sample_item)[:200])
         
         # Process each item
         for item in raw_data:
@@ -604,7 +1267,7 @@ class TenderTrailIntegration:
                 # First check if it's a string that needs to be parsed
                 if isinstance(item, str):
                     try:
-                        parsed_item = json.loads(item)
+                        parsed_item = _json_loads(item)
                         processed_tenders.append(parsed_item)
                         continue
                     except json.JSONDecodeError:
@@ -624,7 +1287,7 @@ class TenderTrailIntegration:
                         if data is not None:
                             if isinstance(data, str):
                                 try:
-                                    parsed_data = json.loads(data)
+                                    parsed_data = _json_loads(data)
                                     processed_tenders.append(parsed_data)
                                     continue
                                 except:
@@ -642,94 +1305,70 @@ class TenderTrailIntegration:
                 processed_tenders.append(item)
                 
             except Exception as e: # This except corresponds to the try block starting the loop iteration
-                print(f"Error processing raw tender item: {e}")
+                logger.error("Error processing raw tender item: %s", e)
                 # Add the raw item anyway, we'll try to handle it in process_source
                 processed_tenders.append(item)
         
         return processed_tenders
     
-    async def _insert_normalized_tenders(self, normalized_tenders: List[Dict[str, Any]], create_tables=True) -> int:
-        """Insert normalized tenders into unified table and return count of successful insertions."""
+    async def _insert_normalized_tenders(self, normalized_tenders: List[Dict[str, Any]], create_tables=True) -> Tuple[int, int]:
+        """Insert normalized tenders into unified table; return (successful insertions, duplicates replaced by a later tender)."""
         if not normalized_tenders:
-            print("No tenders to insert")
-            return 0
+            logger.info("No tenders to insert")
+            return 0, 0
         
         inserted_count = 0
-        tenders_to_insert = [] # Renamed from batch for clarity before the loop
+        upserts = [] # Batch upserts still in flight
+        seen_keys = set() # (source, raw_id) conflict keys already queued in this run
+        duplicate_count = 0
+        upsert_slots = asyncio.Semaphore(UPSERT_CONCURRENCY)
 
         try:
-            print(f"Preparing to insert {len(normalized_tenders)} tenders into unified_tenders")
+            logger.info("Preparing to insert %s tenders into unified_tenders", len(normalized_tenders))
 
             # Ensure necessary tables exist (or log if they don't)
             if create_tables:
-                await self._create_unified_tenders_table()
-                await self._create_errors_table() # <<< ADDED CALL HERE
-
-            # Field mapping between normalized tender fields and database fields
-            field_mapping = {
-                "notice_title": "title",
-                "notice_type": "tender_type",
-                "issuing_authority": "issuing_authority",
-                "date_published": "date_published",
-                "closing_date": "closing_date",
-                "description": "description",
-                "location": "location",
-                "country": "location",  # Use country as fallback for location
-                "source": "source",
-                "tender_value": "tender_value",
-                "currency": "tender_currency",
-                "contact_email": "contact_information",
-                "contact_phone": "contact_information",
-                "contact_information": "contact_information",
-                "cpvs": "keywords",  # Store CPVs as keywords
-                "url": "url",  # Add URL field if exists in db
-                "buyer": "buyer",  # Add buyer field if exists in db
-                "raw_id": "raw_id",
-                "notice_id": "raw_id"  # Use notice_id as fallback for raw_id
-            }
+                await self._ensure_bootstrapped()
 
             translator = None
             try:
                 from deep_translator import GoogleTranslator
                 translator = GoogleTranslator(source='auto', target='en')
-                print("Translation capability is available")
+                logger.debug("Translation capability is available")
             except ImportError:
-                print("deep-translator not available, text translation will be skipped")
+                logger.warning("deep-translator not available, text translation will be skipped")
 
-            metadata_column_exists = False
-            try:
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
-                    lambda: self.supabase.table('unified_tenders').select('metadata').limit(1).execute()
-                )
-                if hasattr(response, 'data'): # Simple check if query succeeded at all
-                    metadata_column_exists = True
-                    print("Metadata column assumed to exist in unified_tenders table after successful check.")
-                # No explicit else, as failure might be due to table not existing yet
-            except Exception as e:
-                if "column" in str(e).lower() and "does not exist" in str(e).lower():
-                    print("Metadata column does not exist in unified_tenders table.")
-                elif "relation" in str(e).lower() and "does not exist" in str(e).lower():
-                    print("'unified_tenders' table likely doesn't exist yet.") # Handle case where table check fails because table is missing
-                else:
-                    print(f"Error checking metadata column: {e}")
+            metadata_column_exists = await self._check_metadata_column()
 
+            # Text fields are only routed through translation when a translator is available
+            if translator:
+                field_plan = _UNIFIED_FIELD_PLAN
+            else:
+                field_plan = tuple(
+                    (norm_field, db_field, False, is_date)
+                    for norm_field, db_field, _is_text, is_date in _UNIFIED_FIELD_PLAN
+                )
 
             # Process each tender in batches
-            batch_size = 50
+            batch_size = UPSERT_BATCH_SIZE
             for i in range(0, len(normalized_tenders), batch_size):
-                current_batch_data = [] # Data for Supabase upsert
+                current_batch_data = {} # Data for Supabase upsert, keyed by (source, raw_id)
+                processed_at = self._get_current_timestamp() # Shared by the whole batch
 
                 # Process tenders in the current sub-batch
                 sub_batch = normalized_tenders[i:i+batch_size]
-                print(f"Processing batch {i//batch_size + 1}: {len(sub_batch)} tenders")
+                logger.info("Processing batch %s: %s tenders", i//batch_size + 1, len(sub_batch))
+
+                # Translate the batch's text up front in a few packed requests; the
+                # field mapping below then reads the results from the cache
+                if translator:
+                    await self._prefetch_translations(translator, sub_batch)
 
                 for tender in sub_batch:
                     try:
                         # Skip empty tenders
                         if not tender or not isinstance(tender, dict):
-                            print(f"Skipping invalid tender data: {type(tender)}")
+                            logger.warning("Skipping invalid tender data: %s", type(tender))
                             continue
 
                         cleaned_tender = {}
@@ -737,45 +1376,45 @@ class TenderTrailIntegration:
 
                         # --- Start Restored Tender Processing Logic --- 
                         # Map fields from normalized tender to database fields
-                        for norm_field, db_field in field_mapping.items():
-                            if norm_field in tender and tender[norm_field] is not None and tender[norm_field] != "":
+                        for norm_field, db_field, is_text, is_date in field_plan:
+                            value = tender.get(norm_field)
+                            if value is not None and value != "":
                                 # Handle translation for specific text fields
-                                if db_field in ["title", "description"] and translator and isinstance(tender[norm_field], str):
-                                    text_to_process = tender[norm_field]
+                                if is_text and isinstance(value, str):
+                                    text_to_process = value
                                     try:
                                         # Simple check for non-English chars (can be improved)
-                                        needs_translation = any(ord(c) > 127 for c in text_to_process)
+                                        needs_translation = not text_to_process.isascii()
                                         translated_text = text_to_process # Default to original
                                         
                                         if needs_translation:
                                             # Check cache first
-                                            if text_to_process in self.translation_cache:
-                                                translated_text = self.translation_cache[text_to_process]
-                                                print(f"Cache hit for translation: '{text_to_process[:30]}...'")
+                                            cached_text = self._cached_translation(text_to_process)
+                                            if cached_text is not None:
+                                                translated_text = cached_text
+                                                logger.debug("Cache hit for translation: '%s...'", text_to_process[:30])
                                             else:
                                                 # Translate using run_in_executor
                                                 loop = asyncio.get_event_loop()
-                                                print(f"Translating text: '{text_to_process[:30]}...'")
+                                                logger.debug("Translating text: '%s...'", text_to_process[:30])
                                                 translated_text = await loop.run_in_executor(
                                                     None,
                                                     lambda: translator.translate(text_to_process)
                                                 )
                                                 # Cache the result
                                                 if translated_text:
-                                                    self.translation_cache[text_to_process] = translated_text
-                                                print(f"Translated text to: '{translated_text[:30]}...'")
+                                                    self._remember_translation(text_to_process, translated_text)
+                                                logger.debug("Translated text to: '%s...'", translated_text[:30])
                                         
                                         cleaned_tender[db_field] = translated_text[:2000] # Limit length
                                     except Exception as te:
-                                        print(f"Translation error for '{text_to_process[:30]}...': {te}")
+                                        logger.warning("Translation error for '%s...': %s", text_to_process[:30], te)
                                         cleaned_tender[db_field] = text_to_process[:2000] # Use original on error
-                                    else:
-                                        cleaned_tender[db_field] = text_to_process[:2000] # Non-translatable or already English
                                 
                                 # Handle combined contact information
                                 elif db_field == "contact_information":
                                     current_contact = cleaned_tender.get(db_field, "")
-                                    new_info = str(tender[norm_field])[:500]
+                                    new_info = str(value)[:500]
                                     if norm_field == "contact_email":
                                         new_info = f"Email: {new_info}"
                                     elif norm_field == "contact_phone":
@@ -787,28 +1426,32 @@ class TenderTrailIntegration:
                                          cleaned_tender[db_field] = new_info
                                 
                                 # Handle date fields
-                                elif db_field in ["date_published", "closing_date"]:
-                                    iso_date = self._parse_date(tender[norm_field]) # Use helper method
+                                elif is_date:
+                                    iso_date = self._parse_date(value) # Use helper method
                                     if iso_date:
                                         cleaned_tender[db_field] = iso_date
                                     else:
-                                        print(f"Could not parse date for {db_field}: {tender[norm_field]}")
+                                        logger.warning("Could not parse date for %s: %s", db_field, value)
                                         
+                                # Plain strings are the common case; skip the container checks
+                                elif type(value) is str:
+                                    cleaned_tender[db_field] = value[:2000]
+                                    
                                 # Handle complex types (dict/list -> JSON string), ensure keywords are joined
-                                elif isinstance(tender[norm_field], (dict, list)):
-                                    if db_field == "keywords" and isinstance(tender[norm_field], list):
+                                elif isinstance(value, (dict, list)):
+                                    if db_field == "keywords" and isinstance(value, list):
                                         # Join list of keywords with commas, limit items and length
-                                        kw_str = ", ".join(str(k)[:50] for k in tender[norm_field][:20])
+                                        kw_str = ", ".join(str(k)[:50] for k in value[:20])
                                         cleaned_tender[db_field] = kw_str[:1000]
                                     else:
                                         try:
-                                            cleaned_tender[db_field] = json.dumps(tender[norm_field])[:2000] # Limit length
+                                            cleaned_tender[db_field] = _truncated_json(value, 2000) # Limit length
                                         except TypeError as json_e:
-                                             print(f"Error serializing field {db_field} to JSON: {json_e}")
-                                             cleaned_tender[db_field] = str(tender[norm_field])[:2000] # Fallback to string
+                                             logger.error("Error serializing field %s to JSON: %s", db_field, json_e)
+                                             cleaned_tender[db_field] = str(value)[:2000] # Fallback to string
                                 else:
                                     # Default: convert to string and limit length
-                                    cleaned_tender[db_field] = str(tender[norm_field])[:2000]
+                                    cleaned_tender[db_field] = str(value)[:2000]
 
                         # Ensure required fields have defaults
                         if not cleaned_tender.get("title"):
@@ -818,128 +1461,200 @@ class TenderTrailIntegration:
                         if not cleaned_tender.get("description"):
                             cleaned_tender["description"] = "No detailed description available."
                         if not cleaned_tender.get("raw_id"):
-                            cleaned_tender["raw_id"] = tender.get("id", str(uuid.uuid4()))
+                            # Only generate an id when the tender has none to fall back on
+                            raw_id = tender.get("id", _MISSING)
+                            cleaned_tender["raw_id"] = token_hex(16) if raw_id is _MISSING else raw_id
                             
                         # Add processed_at timestamp
-                        cleaned_tender["processed_at"] = self._get_current_timestamp()
+                        cleaned_tender["processed_at"] = processed_at
 
-                        # Add metadata if column exists and data is present
+                        # Add metadata if column exists and data is present. The column is JSONB, so
+                        # it goes out as an object rather than a JSON string; it is coerced per row so
+                        # a nested datetime or Decimal can't fail serialization of the whole batch.
                         if metadata_column_exists and metadata:
-                            try:
-                                cleaned_tender['metadata'] = json.dumps(metadata)
-                            except TypeError as json_meta_e:
-                                print(f"Error serializing metadata to JSON: {json_meta_e}")
-                                cleaned_tender['metadata'] = json.dumps(str(metadata)) # Fallback
+                            cleaned_tender['metadata'] = _jsonb_value(metadata)
                         # --- End Restored Tender Processing Logic --- 
 
-                        # Add the fully processed tender to the list for insertion
+                        # Keep the last row per conflict key, as separate upserts would: two rows
+                        # with one key in a batch make the whole upsert fail
+                        conflict_key = (cleaned_tender["source"], str(cleaned_tender["raw_id"]))
+                        if conflict_key in current_batch_data:
+                            duplicate_count += 1
+
+                        # Add the fully processed tender to the batch for insertion
                         if cleaned_tender: # Ensure we didn't add empty dicts
-                            current_batch_data.append(cleaned_tender)
+                            current_batch_data[conflict_key] = cleaned_tender
 
                     except Exception as tender_proc_e:
-                        print(f"CRITICAL Error processing tender {tender.get('id', 'N/A')} for insertion: {tender_proc_e}")
-                        traceback.print_exc()
-                        # Log this specific error to the errors table
+                        logger.error("Error processing tender %s for insertion: %s", tender.get('id', 'N/A'), tender_proc_e)
+                        # Per-tender failures can be frequent; only format the traceback when debugging
+                        logger.debug("Traceback for tender insertion failure", exc_info=True)
+                        # Queue this specific error for the errors table
                         try:
-                            error_payload = {
+                            await self._queue_error({
                                 "source": self._current_source or tender.get('source', "unknown"),
                                 "error_message": f"Tender processing failed: {tender_proc_e}",
-                                "tender_data": json.dumps(tender, default=str), # Log original tender
+                                "tender_data": _error_data(tender), # Log original tender, bounded
                                 "context": "Individual tender processing failure"
-                            }
-                            loop = asyncio.get_event_loop()
-                            await loop.run_in_executor(
-                                None,
-                                lambda: self.supabase.table('errors').insert(error_payload).execute()
-                             )
+                            })
                         except Exception as log_proc_err_e:
-                            print(f"Failed to log tender processing error to 'errors' table: {log_proc_err_e}")
+                            logger.error("Failed to queue tender processing error for 'errors' table: %s", log_proc_err_e)
 
-                # Insert the prepared batch into the database
+                # Hand the prepared batch to a background upsert and move on to the next one
                 if current_batch_data:
-                    print(f"Attempting to upsert batch of {len(current_batch_data)} tenders...")
-                    try:
-                        print(f"DEBUG: Sample data for batch upsert: {str(current_batch_data[0])[:500]}...")
-                    except Exception as log_e:
-                        print(f"DEBUG: Error logging sample batch data: {log_e}")
-
-                    try:
-                        loop = asyncio.get_event_loop()
-                        # Use upsert with source and raw_id as conflict identifiers
-                        response = await loop.run_in_executor(
-                            None,
-                            lambda: self.supabase.table('unified_tenders')
-                                        .upsert(current_batch_data, on_conflict='source,raw_id')
-                                        .execute()
-                        )
-                        if hasattr(response, 'data') and response.data:
-                           print(f"Successfully upserted batch. Response count: {len(response.data)}")
-                           inserted_count += len(response.data)
-                        elif hasattr(response, 'status_code') and 200 <= response.status_code < 300:
-                            # Sometimes upsert might return success status without data array
-                            print(f"Successfully upserted batch (status code: {response.status_code}). Assuming count: {len(current_batch_data)}")
-                            inserted_count += len(current_batch_data) # Assume all succeeded if status is ok
-                        else:
-                           print(f"Upsert batch completed but response indicates potential issue or no data returned. Response: {response}")
-                           # Log the failed batch to the errors table for review
-                           # (Code for logging already exists below)
-
-                    except Exception as db_e:
-                        print(f"DATABASE UPSERT ERROR for batch: {db_e}")
-                        traceback.print_exc()
-                        # Log the entire batch that failed
-                        try:
-                            error_payload = {
-                                "source": self._current_source or "unknown", 
-                                "error_message": str(db_e),
-                                "tender_data": json.dumps(current_batch_data, default=str), 
-                                "context": "Batch upsert failure"
-                            }
-                            await loop.run_in_executor(
-                                None,
-                                lambda: self.supabase.table('errors').insert(error_payload).execute()
-                             )
-                            print("Logged batch upsert error to 'errors' table.")
-                        except Exception as log_err_e:
-                            print(f"Failed to log batch upsert error to 'errors' table: {log_err_e}")
+                    # A key already sent by an earlier batch must land after it, so its last
+                    # version wins; wait for the upserts in flight before sending it again
+                    if upserts and not seen_keys.isdisjoint(current_batch_data):
+                        inserted_count += sum(await asyncio.gather(*upserts))
+                        upserts.clear()
+                    seen_keys.update(current_batch_data)
+                    upserts.append(asyncio.ensure_future(
+                        self._upsert_batch(list(current_batch_data.values()), upsert_slots)
+                    ))
+                    # Keep at most UPSERT_CONCURRENCY prepared batches alive: waiting on the oldest
+                    # releases its rows, so memory stays bounded however many tenders come in
+                    if len(upserts) > UPSERT_CONCURRENCY:
+                        inserted_count += await upserts.pop(0)
 
         # Outer exception handler for the whole insertion process
         except Exception as e:
-            print(f"CRITICAL Error during overall tender insertion process: {e}")
-            traceback.print_exc()
+            logger.exception("Error during overall tender insertion process: %s", e)
+
+        if duplicate_count:
+            logger.info("Replaced %s duplicate tenders by a later one (same source and raw_id)", duplicate_count)
 
-        print(f"Total successfully upserted/inserted tenders in this run: {inserted_count}")
-        return inserted_count
+        # Wait for the outstanding batch upserts
+        if upserts:
+            inserted_count += sum(await asyncio.gather(*upserts))
+
+        # Write any queued error records in one round-trip
+        await self._flush_errors()
+
+        logger.info("Total successfully upserted/inserted tenders in this run: %s", inserted_count)
+        return inserted_count, duplicate_count
+
+    async def _check_metadata_column(self) -> bool:
+        """Check whether unified_tenders has the metadata column, probing once per process."""
+        if 'unified_tenders.metadata' in self._ready_tables:
+            return True
+        try:
+            # limit(0) only asks PostgREST to resolve the column; no rows come back
+            loop = asyncio.get_event_loop()
+            response = await loop.run_in_executor(
+                None,
+                lambda: self.supabase.table('unified_tenders').select('metadata').limit(0).execute()
+            )
+            if hasattr(response, 'data'): # Simple check if query succeeded at all
+                self._ready_tables.add('unified_tenders.metadata')
+                logger.debug("Metadata column assumed to exist in unified_tenders table after successful check.")
+                return True
+            # No explicit else, as failure might be due to table not existing yet
+        except Exception as e:
+            if "column" in str(e).lower() and "does not exist" in str(e).lower():
+                logger.warning("Metadata column does not exist in unified_tenders table.")
+            elif "relation" in str(e).lower() and "does not exist" in str(e).lower():
+                logger.warning("'unified_tenders' table likely doesn't exist yet.") # Handle case where table check fails because table is missing
+            else:
+                logger.error("Error checking metadata column: %s", e)
+        return False
+
+    async def _upsert_batch(self, batch_data: List[Dict[str, Any]], slots: asyncio.Semaphore) -> int:
+        """Upsert one prepared batch into unified_tenders and return the number of rows written."""
+        async with slots:
+            logger.debug("Attempting to upsert batch of %s tenders...", len(batch_data))
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    logger.debug("Sample data for batch upsert: %s...", str(batch_data[0])[:500])
+                except Exception as log_e:
+                    logger.debug("Error logging sample batch data: %s", log_e)
+
+            try:
+                loop = asyncio.get_event_loop()
+                # Use upsert with source and raw_id as conflict identifiers. The rows are not
+                # sent back (return=minimal); the exact count header reports how many were written.
+                response = await loop.run_in_executor(
+                    None,
+                    lambda: self.supabase.table('unified_tenders')
+                                .upsert(batch_data, on_conflict='source,raw_id', returning='minimal', count='exact')
+                                .execute()
+                )
+                if getattr(response, 'count', None) is not None:
+                    logger.info("Successfully upserted batch. Row count: %s", response.count)
+                    return response.count
+                elif hasattr(response, 'data') and response.data:
+                    logger.info("Successfully upserted batch. Response count: %s", len(response.data))
+                    return len(response.data)
+                elif hasattr(response, 'status_code') and 200 <= response.status_code < 300:
+                    # Sometimes upsert might return success status without data array
+                    logger.info("Successfully upserted batch (status code: %s). Assuming count: %s", response.status_code, len(batch_data))
+                    return len(batch_data) # Assume all succeeded if status is ok
+                else:
+                    logger.warning("Upsert batch completed but response indicates potential issue or no data returned. Response: %s", response)
+                    # Log the failed batch to the errors table for review
+                    await self._queue_batch_error(batch_data, f"Upsert returned no row count or data: {response}")
+
+            except Exception as db_e:
+                logger.exception("DATABASE UPSERT ERROR for batch: %s", db_e)
+                await self._queue_batch_error(batch_data, str(db_e))
+        return 0
+
+    async def _queue_batch_error(self, batch_data: List[Dict[str, Any]], error_message: str) -> None:
+        """Queue an error record for a batch upsert that didn't go through."""
+        # Identify the rows of the failed batch rather than storing all of them
+        try:
+            await self._queue_error({
+                "source": self._current_source or "unknown", 
+                "error_message": error_message,
+                "tender_data": _error_data({
+                    "rows": len(batch_data),
+                    "raw_ids": [row.get("raw_id") for row in batch_data],
+                }), 
+                "context": "Batch upsert failure"
+            })
+            logger.info("Queued batch upsert error for 'errors' table.")
+        except Exception as log_err_e:
+            logger.error("Failed to queue batch upsert error for 'errors' table: %s", log_err_e)
+
+    async def _ensure_bootstrapped(self) -> None:
+        """Run the table existence checks once per instance, on first use."""
+        if self._ensured_tables:
+            return
+        await self._create_unified_tenders_table()
+        await self._create_errors_table()
+        self._ensured_tables = True
 
     async def _create_unified_tenders_table(self) -> None:
         """Create unified_tenders table if it doesn't exist with all required columns."""
+        if 'unified_tenders' in self._ready_tables:
+            return
         try:
             # Check if table already exists
             table_exists = False
             try:
-                # Try direct query to see if table exists
+                # Try direct query to see if table exists (limit(0): no rows are transferred)
                 loop = asyncio.get_event_loop()
                 response = await loop.run_in_executor(
                     None,
-                    lambda: self.supabase.table('unified_tenders').select('id').limit(1).execute()
+                    lambda: self.supabase.table('unified_tenders').select('id').limit(0).execute()
                 )
                 if hasattr(response, 'data'):
                     table_exists = True
-                    print("unified_tenders table already exists")
+                    self._ready_tables.add('unified_tenders')
+                    logger.debug("unified_tenders table already exists")
                     return
             except Exception as e:
                 if "relation" in str(e) and "does not exist" in str(e):
-                    print("unified_tenders table doesn't exist, but may be created by another process")
+                    logger.warning("unified_tenders table doesn't exist, but may be created by another process")
                 else:
-                    print(f"Error checking unified_tenders table: {e}")
+                    logger.error("Error checking unified_tenders table: %s", e)
             
             if table_exists:
                 return
             
             # In API-only mode, we can't create tables directly
-            print("Cannot create unified_tenders table in API-only mode")
-            print("Please create the table using the Supabase UI or SQL Editor with this schema:")
-            print("""
+            logger.warning("Cannot create unified_tenders table in API-only mode")
+            logger.warning("Please create the table using the Supabase UI or SQL Editor with this schema:")
+            logger.warning("""
             CREATE TABLE IF NOT EXISTS public.unified_tenders (
                 id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
                 title TEXT,
@@ -966,12 +1681,14 @@ class TenderTrailIntegration:
             """)
             
             # Try inserting into the table anyway - it might exist but select was rejected due to permissions
-            print("Will attempt to continue operations assuming the table exists")
+            logger.info("Will attempt to continue operations assuming the table exists")
         except Exception as e:
-            print(f"Error in _create_unified_tenders_table: {e}")
+            logger.error("Error in _create_unified_tenders_table: %s", e)
 
     async def _create_errors_table(self) -> None:
         """Create the 'errors' table if it doesn't exist."""
+        if 'errors' in self._ready_tables:
+            return
         loop = asyncio.get_event_loop()
         table_name = 'errors'
         try: # Outer try for the whole operation (Line 874)
@@ -979,26 +1696,27 @@ class TenderTrailIntegration:
             try: # Inner try for the check query
                 response = await loop.run_in_executor(
                     None,
-                    lambda: self.supabase.table(table_name).select('id', count='exact').limit(1).execute()
+                    lambda: self.supabase.table(table_name).select('id').limit(0).execute()
                 )
-                if response.count is not None:
-                     print(f"'{table_name}' table already exists.")
+                if hasattr(response, 'data'):
+                     self._ready_tables.add(table_name)
+                     logger.debug("'%s' table already exists.", table_name)
                      return # Table exists, nothing more to do
             except Exception as e:
                  # Handle errors during the check phase
                  if "relation" in str(e).lower() and "does not exist" in str(e).lower():
-                     print(f"'{table_name}' table does not exist. Will proceed to inform user for manual creation.")
+                     logger.warning("'%s' table does not exist. Will proceed to inform user for manual creation.", table_name)
                  else:
-                     print(f"Error checking '{table_name}' existence: {e}")
+                     logger.error("Error checking '%s' existence: %s", table_name, e)
                      # Depending on error, may want to raise or return here instead of proceeding
 
             # If code reaches here, table either doesn't exist or the check failed.
             # Inform user about manual creation as client libs typically can't CREATE TABLE.
-            print(f"Cannot create '{table_name}' table directly via client library.")
-            print("Please ensure the table exists or create it using the Supabase UI or SQL Editor.")
-            print("Recommended schema:")
+            logger.warning("Cannot create '%s' table directly via client library.", table_name)
+            logger.warning("Please ensure the table exists or create it using the Supabase UI or SQL Editor.")
+            logger.warning("Recommended schema:")
             # Correctly formatted triple-quoted string
-            print("""
+            logger.warning("""
             CREATE TABLE IF NOT EXISTS public.errors (
                 id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
                 created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
@@ -1012,7 +1730,32 @@ class TenderTrailIntegration:
 
         # <<< Correctly aligned except block for the outer try (Line 874) >>>
         except Exception as general_e:
-            print(f"General error during '{table_name}' table check/creation info: {general_e}")
+            logger.warning("General error during '%s' table check/creation info: %s", table_name, general_e)
+
+    async def _queue_error(self, error_payload: Dict[str, Any]) -> None:
+        """Buffer an error record, flushing once the buffer reaches ERROR_FLUSH_SIZE."""
+        self._error_buffer.append(error_payload)
+        if len(self._error_buffer) >= ERROR_FLUSH_SIZE:
+            await self._flush_errors()
+
+    async def _flush_errors(self) -> None:
+        """Insert all buffered error records into the 'errors' table in multi-row chunks."""
+        if not self._error_buffer:
+            return
+        
+        rows = self._error_buffer
+        self._error_buffer = []
+        loop = asyncio.get_event_loop()
+        for start in range(0, len(rows), ERROR_INSERT_CHUNK):
+            chunk = rows[start:start + ERROR_INSERT_CHUNK]
+            try:
+                await loop.run_in_executor(
+                    None,
+                    lambda: self.supabase.table('errors').insert(chunk, returning='minimal').execute()
+                )
+                logger.info("Logged %s error records to 'errors' table.", len(chunk))
+            except Exception as e:
+                logger.error("Failed to log %s error records to 'errors' table: %s", len(chunk), e)
 
     def _insert_error(self, source: str, error_type: str, error_message: str, tender_data: str = "") -> None:
         """Log an error to the console."""
@@ -1022,15 +1765,15 @@ class TenderTrailIntegration:
                 tender_data = tender_data[:10000] + "... [truncated]"
             
             # Log to console
-            print(f"ERROR RECORD [{source}] - Type: {error_type}")
-            print(f"ERROR MESSAGE: {error_message[:200]}")
+            logger.error("ERROR RECORD [%s] - Type: %s", source, error_type)
+            logger.error("ERROR MESSAGE: %s", error_message[:200])
             if tender_data:
-                print(f"ERROR DATA: {tender_data[:200]}...")
+                logger.error("ERROR DATA: %s...", tender_data[:200])
             
         except Exception as e:
-            print(f"Error in _insert_error: {e}")
+            logger.error("Error in _insert_error: %s", e)
             # Log the original error to make sure it's visible
-            print(f"Original error: [{source}] {error_type}: {error_message[:200]}")
+            logger.warning("Original error: [%s] %s: %s", source, error_type, error_message[:200])
 
     def _parse_date(self, date_str):
         """Parse a date string into ISO format (YYYY-MM-DD)."""
@@ -1039,92 +1782,76 @@ class TenderTrailIntegration:
     
         if isinstance(date_str, (int, float)):
             # Unix timestamp
-            import datetime
             try:
                 return datetime.datetime.fromtimestamp(date_str).strftime('%Y-%m-%d')
-            except:
+            except (ValueError, OverflowError, OSError):
                 return None
         
-        # If already ISO format, return as is
-        if isinstance(date_str, str) and len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
-            return date_str
-        
-        # Try to parse with dateutil
-        try:
-            from dateutil import parser
-            parsed_date = parser.parse(date_str)
-            return parsed_date.strftime('%Y-%m-%d')
-        except ImportError:
-            print("dateutil not installed, using basic date parsing")
-        except Exception as e:
-            print(f"Error parsing date with dateutil: {e}")
-        
-        # Fallback to basic parsing
-        try:
-            # Try common formats
-            import datetime
-            
-            # List of common date formats to try
-            formats = [
-                '%Y-%m-%d', '%d-%m-%Y', '%m-%d-%Y',
-                '%Y/%m/%d', '%d/%m/%Y', '%m/%d/%Y',
-                '%d.%m.%Y', '%m.%d.%Y', '%Y.%m.%d',
-                '%b %d, %Y', '%B %d, %Y', '%d %b %Y', '%d %B %Y',
-                '%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%SZ',
-                '%a, %d %b %Y %H:%M:%S %Z'
-            ]
-            
-            for fmt in formats:
-                try:
-                    parsed_date = datetime.datetime.strptime(date_str, fmt)
-                    return parsed_date.strftime('%Y-%m-%d')
-                except:
-                    continue
-            
-            # If none of the formats worked, try to extract date with regex
-            import re
-            
-            # Pattern for YYYY-MM-DD or similar
-            iso_pattern = r'(\d{4})[-/.](\d{1,2})[-/.](\d{1,2})'
-            iso_match = re.search(iso_pattern, date_str)
-            if iso_match:
-                year, month, day = iso_match.groups()
-                return f"{year}-{int(month):02d}-{int(day):02d}"
-            
-            # Pattern for DD-MM-YYYY or similar
-            dmy_pattern = r'(\d{1,2})[-/.](\d{1,2})[-/.](\d{4})'
-            dmy_match = re.search(dmy_pattern, date_str)
-            if dmy_match:
-                day, month, year = dmy_match.groups()
-                return f"{year}-{int(month):02d}-{int(day):02d}"
-            
-            # If all else fails, return None
-            return None
-        except Exception as e:
-            print(f"Error in basic date parsing: {e}")
-            return None
+        # Text dates repeat heavily within a feed, so parsed strings are memoized
+        if type(date_str) is str:
+            return _parse_date_text_cached(date_str)
+        return _parse_date_text(date_str)
     
     def _is_valid_date_format(self, date_str):
         """Check if a date string is in valid ISO format."""
-        if not date_str:
+        if not isinstance(date_str, str):
             return False
         
-        # Check basic ISO format (YYYY-MM-DD)
-        if isinstance(date_str, str) and len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
-            try:
-                year, month, day = date_str.split('-')
-                # Check valid ranges
-                if 1900 <= int(year) <= 2100 and 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
-                    return True
-            except:
-                pass
+        return _is_iso_date_text(date_str)
+
+    async def _prefetch_translations(self, translator, tenders):
+        """Translate the uncached non-ASCII text fields of a batch in packed requests."""
+        pending = {}
+        for tender in tenders:
+            if not isinstance(tender, dict):
+                continue
+            for norm_field in _TRANSLATED_FIELDS:
+                text = tender.get(norm_field)
+                if (isinstance(text, str) and text and text not in pending
+                        and not text.isascii()
+                        and self._cached_translation(text) is None):
+                    pending[text] = None
+        if not pending:
+            return
         
-        return False
+        loop = asyncio.get_event_loop()
+        slots = asyncio.Semaphore(TRANSLATION_CONCURRENCY)
+        
+        async def translate(texts):
+            async with slots:
+                return await loop.run_in_executor(
+                    None, functools.partial(_translate_joined, translator, texts)
+                )
+        
+        requests = _pack_translation_requests(pending)
+        results = await asyncio.gather(*(translate(texts) for texts in requests), return_exceptions=True)
+        
+        # Results are cached here, on the event loop, rather than from the worker threads
+        for texts, translations in zip(requests, results):
+            if isinstance(translations, Exception):
+                logger.debug("Packed translation of %s strings failed: %s", len(texts), translations)
+                continue
+            for text, translated in zip(texts, translations):
+                if translated:
+                    self._remember_translation(text, translated)
+
+    def _cached_translation(self, text):
+        """Return the cached translation of text, or None, marking it recently used."""
+        translated = self.translation_cache.get(text)
+        if translated is not None:
+            self.translation_cache.move_to_end(text)
+        return translated
+
+    def _remember_translation(self, text, translated):
+        """Cache a translation, evicting the least recently used beyond TRANSLATION_CACHE_SIZE."""
+        self.translation_cache[text] = translated
+        self.translation_cache.move_to_end(text)
+        if len(self.translation_cache) > TRANSLATION_CACHE_SIZE:
+            self.translation_cache.popitem(last=False)
 
     def _get_current_timestamp(self):
-        """Get current timestamp in ISO format."""
-        import datetime
-        return datetime.datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')
+        """Get current UTC timestamp in ISO format."""
+        return datetime.datetime.now(_UTC).isoformat(timespec='seconds')
 
     def _extract_address_information(self, description):
         """Extract address information from description text."""
@@ -1188,7 +1915,7 @@ class TenderTrailIntegration:
         if not raw_data:
             return []
             
-        print(f"Processing {len(raw_data)} raw tenders with enhanced validation")
+        logger.info("Processing %s raw tenders with enhanced validation", len(raw_data))
         
         # Track already processed tenders to avoid duplicates
         processed_tenders = []
@@ -1209,7 +1936,7 @@ class TenderTrailIntegration:
                     if structured_data:
                         cleaned_data.append(structured_data)
                     else:
-                        print(f"Unable to extract structured data from string: {item}")
+                        logger.warning("Unable to extract structured data from string: %s", item)
                         continue
                         
                 # If it's a dictionary, use it directly
@@ -1231,108 +1958,65 @@ class TenderTrailIntegration:
                     if structured_data:
                         cleaned_data.append(structured_data)
                     else:
-                        print(f"Unable to extract structured data from item of type {type(item)}")
+                        logger.warning("Unable to extract structured data from item of type %s", type(item))
                         continue
                         
             except Exception as e:
-                print(f"Error cleaning tender: {e}")
+                logger.error("Error cleaning tender: %s", e)
                 error_tenders += 1
                 
         # Get schemas
         source_schema = await self._get_source_schema(source_name)
         target_schema = await self._get_target_schema()
         
-        # Second pass to normalize and validate
-        for tender in cleaned_data:
-            try:
-                # Debug info for tender type
-                print(f"DEBUG: Processing tender of type {type(tender)}")
-                
-                # Ensure tender is a dictionary
-                if not isinstance(tender, dict):
-                    print(f"WARNING: Expected dict but got {type(tender)}: {str(tender)[:100]}")
-                    tender = self._ensure_dict(tender)
-                    print(f"DEBUG: Converted to dict: {str(tender)[:100]}")
-                
-                # Preprocess the tender using the preprocessor if available
-                preprocessed_tender = None
-                if hasattr(self, 'preprocessor') and self.preprocessor:
-                    try:
-                        # Pass both tender and source_schema
-                        preprocessed_tender = self.preprocessor.preprocess(tender, source_schema)
-                        if preprocessed_tender:
-                            # Add source name if missing
-                            if 'source' not in preprocessed_tender:
-                                preprocessed_tender['source'] = source_name
-                    except Exception as preproc_e:
-                        print(f"Error during preprocessing: {preproc_e}")
-                        # Continue with original tender
-                        preprocessed_tender = None
-                
-                # Use the preprocessed tender if available, otherwise use the original
-                tender_to_normalize = preprocessed_tender if preprocessed_tender else tender
-                
-                # Debug info for tender_to_normalize
-                print(f"DEBUG: Tender to normalize - Type: {type(tender_to_normalize)}")
-                
-                # Try to use the LLM normalizer if available
-                normalized_tender = None
-                if hasattr(self, 'normalizer') and self.normalizer:
-                    try:
-                        # Use run_in_executor to run synchronous normalize_tender in a thread pool
-                        loop = asyncio.get_event_loop()
-                        normalized_tender = await loop.run_in_executor(
-                            None,
-                            lambda: self.normalizer.normalize_tender(
-                                tender_to_normalize, 
-                                source_schema, 
-                                target_schema
-                            )
-                        )
-                        
-                        # Ensure required fields from the integration perspective
-                        if normalized_tender:
-                            # Add source name if missing
-                            if 'source' not in normalized_tender:
-                                normalized_tender['source'] = source_name
-                                
-                            # Map field names to match our expected schema
-                            # (Since LLM might return fields like 'title' instead of 'notice_title')
-                            field_mapping = {
-                                'title': 'notice_title',
-                                'description': 'description',
-                                'date_published': 'date_published',
-                                'closing_date': 'closing_date',
-                                'tender_value': 'tender_value',
-                                'tender_currency': 'currency',
-                                'location': 'location',
-                                'issuing_authority': 'issuing_authority'
-                            }
-                            
-                            for llm_field, int_field in field_mapping.items():
-                                if llm_field in normalized_tender and int_field not in normalized_tender:
-                                    normalized_tender[int_field] = normalized_tender[llm_field]
-                    except Exception as llm_e:
-                        print(f"Error during LLM normalization: {llm_e}")
-                        normalized_tender = None
-                
-                # Fallback to rule-based normalization if LLM failed
-                if not normalized_tender:
-                    print("Falling back to rule-based normalization")
-                    normalized_tender = self._normalize_tender(tender_to_normalize, source_name)
+        # Per-tender normalization time in seconds, preallocated as one contiguous buffer
+        timings = array('d', bytes(8 * len(cleaned_data)))
+        
+        # Normalize concurrently: the per-tender cost is dominated by LLM round trips run in
+        # the default thread pool. Duplicate detection depends on earlier results, so it and
+        # validation run afterwards in input order.
+        slots = asyncio.Semaphore(NORMALIZE_CONCURRENCY)
+        
+        async def normalize_timed(index, tender):
+            async with slots:
+                started = time.perf_counter()
+                try:
+                    return await self._normalize_single_tender(tender, source_name, source_schema, target_schema)
+                finally:
+                    timings[index] = time.perf_counter() - started
+        
+        results = await asyncio.gather(
+            *(normalize_timed(index, tender) for index, tender in enumerate(cleaned_data)),
+            return_exceptions=True
+        )
+        
+        # Write the normalizer's caches once for the whole batch rather than once per tender
+        save_caches = getattr(self.normalizer, 'save_caches', None)
+        if save_caches:
+            await asyncio.get_event_loop().run_in_executor(None, save_caches)
+        
+        # Second pass to deduplicate and validate
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error during tender normalization: %s", result)
+                error_tenders += 1
+                continue
                 
+            normalized_tender, rule_based = result
+            try:
                 if not normalized_tender:
                     skipped_tenders += 1
                     continue
                     
                 # Check if this might be a duplicate of something we already processed
                 if self._detect_potential_duplicate(normalized_tender, processed_tenders):
-                    print(f"Skipping potential duplicate: {normalized_tender.get('notice_title', '')[:50]}...")
+                    logger.debug("Skipping potential duplicate: %s...", normalized_tender.get('notice_title', '')[:50])
                     skipped_tenders += 1
                     continue
                     
                 # Validate and clean the tender data
-                is_valid, validation_message = self._validate_normalized_tender(normalized_tender)
+                # (the rule-based normalizer has already brought its dates to ISO format)
+                is_valid, validation_message = self._validate_normalized_tender(normalized_tender, dates_checked=rule_based)
                 
                 if is_valid:
                     # Extract address info if available
@@ -1346,16 +2030,101 @@ class TenderTrailIntegration:
                     
                     processed_tenders.append(normalized_tender)
                 else:
-                    print(f"Validation failed: {validation_message}")
+                    logger.warning("Validation failed: %s", validation_message)
                     skipped_tenders += 1
                     
             except Exception as e:
-                print(f"Error during tender normalization: {e}")
+                logger.error("Error during tender normalization: %s", e)
                 error_tenders += 1
                 
-        print(f"Enhanced processing results: {len(processed_tenders)} valid tenders, {skipped_tenders} skipped, {error_tenders} errors")
+        logger.info("Enhanced processing results: %s valid tenders, %s skipped, %s errors", len(processed_tenders), skipped_tenders, error_tenders)
+        if timings:
+            logger.info("Normalization time per tender: mean %.2f ms, max %.2f ms",
+                        sum(timings) / len(timings) * 1000, max(timings) * 1000)
         return processed_tenders
 
+    async def _normalize_single_tender(self, tender, source_name, source_schema, target_schema):
+        """
+        Preprocess and normalize one tender, falling back to the rule-based normalizer.
+        
+        Args:
+            tender: Cleaned tender data
+            source_name (str): Source name for context-specific processing
+            source_schema (dict): Schema of the source table
+            target_schema (dict): Schema of the normalized output
+            
+        Returns:
+            tuple: (normalized tender or None, whether the rule-based normalizer produced it)
+        """
+        # Debug info for tender type
+        logger.debug("Processing tender of type %s", type(tender))
+        
+        # Ensure tender is a dictionary
+        if not isinstance(tender, dict):
+            logger.warning("Expected dict but got %s: %s", type(tender), str(tender)[:100])
+            tender = self._ensure_dict(tender)
+            logger.debug("Converted to dict: %s", str(tender)[:100])
+        
+        # Preprocess the tender using the preprocessor if available
+        preprocessed_tender = None
+        if hasattr(self, 'preprocessor') and self.preprocessor:
+            try:
+                # Pass both tender and source_schema
+                preprocessed_tender = self.preprocessor.preprocess(tender, source_schema)
+                if preprocessed_tender:
+                    # Add source name if missing
+                    if 'source' not in preprocessed_tender:
+                        preprocessed_tender['source'] = source_name
+            except Exception as preproc_e:
+                logger.error("Error during preprocessing: %s", preproc_e)
+                # Continue with original tender
+                preprocessed_tender = None
+        
+        # Use the preprocessed tender if available, otherwise use the original
+        tender_to_normalize = preprocessed_tender if preprocessed_tender else tender
+        
+        # Debug info for tender_to_normalize
+        logger.debug("Tender to normalize - Type: %s", type(tender_to_normalize))
+        
+        # Try to use the LLM normalizer if available
+        normalized_tender = None
+        if hasattr(self, 'normalizer') and self.normalizer:
+            try:
+                # Use run_in_executor to run synchronous normalize_tender in a thread pool
+                loop = asyncio.get_event_loop()
+                normalized_tender = await loop.run_in_executor(
+                    None,
+                    lambda: self.normalizer.normalize_tender(
+                        tender_to_normalize, 
+                        source_schema, 
+                        target_schema
+                    )
+                )
+                
+                # Ensure required fields from the integration perspective
+                if normalized_tender:
+                    # Add source name if missing
+                    if 'source' not in normalized_tender:
+                        normalized_tender['source'] = source_name
+                        
+                    # Map field names to match our expected schema
+                    # (Since LLM might return fields like 'title' instead of 'notice_title')
+                    for llm_field, int_field in _LLM_FIELD_ALIASES:
+                        if llm_field in normalized_tender and int_field not in normalized_tender:
+                            normalized_tender[int_field] = normalized_tender[llm_field]
+            except Exception as llm_e:
+                logger.error("Error during LLM normalization: %s", llm_e)
+                normalized_tender = None
+        
+        # Fallback to rule-based normalization if LLM failed
+        rule_based = False
+        if not normalized_tender:
+            logger.debug("Falling back to rule-based normalization")
+            normalized_tender = self._normalize_tender(tender_to_normalize, source_name)
+            rule_based = True
+        
+        return normalized_tender, rule_based
+
     async def _extract_structured_data(self, content, source):
         """
         Extract structured data from various content formats.
@@ -1371,7 +2140,7 @@ class TenderTrailIntegration:
         try:
             # Print some debug info to see what we're working with
             content_preview = str(content)[:100] if isinstance(content, (str, bytes)) else type(content).__name__
-            print(f"Extracting data from content type {type(content)}: {content_preview}...")
+            logger.debug("Extracting data from content type %s: %s...", type(content), content_preview)
 
             # --- Handle String Content ---
             if isinstance(content, str):
@@ -1379,24 +2148,24 @@ class TenderTrailIntegration:
 
                 # If it's a short string, potentially an ID
                 if 0 < len(content_strip) < 50 and content_strip.isalnum():
-                    print(f"Content is short, trying to use it as an ID: {content_strip}")
+                    logger.debug("Content is short, trying to use it as an ID: %s", content_strip)
                     try:
                         response = await loop.run_in_executor(
                             None,
                             lambda: self.supabase.table(source).select('*').eq('id', content_strip).limit(1).execute()
                         )
                         if hasattr(response, 'data') and response.data:
-                            print(f"Found tender by ID {content_strip}")
+                            logger.debug("Found tender by ID %s", content_strip)
                             fetched_data = response.data[0]
                             if isinstance(fetched_data, dict):
                                 fetched_data['source'] = source # Ensure source is set
                                 return fetched_data
                             else:
-                                print(f"Fetched data for ID {content_strip} is not a dict.")
+                                logger.debug("Fetched data for ID %s is not a dict.", content_strip)
                         else:
-                            print(f"No tender found for ID {content_strip}")
+                            logger.debug("No tender found for ID %s", content_strip)
                     except Exception as e:
-                        print(f"Failed to fetch tender by ID '{content_strip}': {e}")
+                        logger.error("Failed to fetch tender by ID '%s': %s", content_strip, e)
                     # Fall through to treat as text if ID fetch fails or returns nothing
 
                 # Try to identify XML
@@ -1406,10 +2175,10 @@ class TenderTrailIntegration:
                         root = ET.fromstring(content_strip)
                         xml_dict = self._xml_to_dict(root)
                         xml_dict['source'] = source
-                        print("Parsed content as XML")
+                        logger.debug("Parsed content as XML")
                         return xml_dict
                     except Exception as xml_e:
-                        print(f"XML parsing failed (will treat as text): {xml_e}") # Don't stop, treat as text
+                        logger.warning("XML parsing failed (will treat as text): %s", xml_e) # Don't stop, treat as text
 
                 # Try to identify HTML
                 if '<html' in content.lower() or '<body' in content.lower():
@@ -1427,7 +2196,7 @@ class TenderTrailIntegration:
                         if not body_text:
                              body_text = soup.get_text(" ", strip=True) # Fallback to all text
 
-                        print("Parsed content as HTML")
+                        logger.debug("Parsed content as HTML")
                         return {
                             'title': title,
                             'description': body_text[:5000], # Limit length
@@ -1435,33 +2204,33 @@ class TenderTrailIntegration:
                             'raw_data_type': 'html'
                         }
                     except ImportError:
-                        print("BeautifulSoup not installed, using basic HTML cleaning.")
+                        logger.debug("BeautifulSoup not installed, using basic HTML cleaning.")
                         # Basic cleaning is likely already done, treat as text
                     except Exception as html_e:
-                        print(f"HTML parsing failed (will treat as text): {html_e}") # Don't stop, treat as text
+                        logger.warning("HTML parsing failed (will treat as text): %s", html_e) # Don't stop, treat as text
 
 
                 # Try parsing as JSON (if it looks like it)
                 if (content_strip.startswith('{') and content_strip.endswith('}')) or \
                    (content_strip.startswith('[') and content_strip.endswith(']')):
                     try:
-                        parsed = json.loads(content_strip)
+                        parsed = _json_loads(content_strip)
                         if isinstance(parsed, dict):
                             parsed['source'] = source
-                            print("Parsed content as JSON object")
+                            logger.debug("Parsed content as JSON object")
                             return parsed
                         elif isinstance(parsed, list) and parsed:
                              # If list of dicts, maybe take the first? Or try to merge? For now, wrap it.
-                             print("Parsed content as JSON list, wrapping.")
+                             logger.debug("Parsed content as JSON list, wrapping.")
                              return {'title': f"List data from {source}", 'data_list': parsed, 'source': source, 'raw_data_type': 'json_list'}
                         # else: Fall through if empty list or non-dict/list JSON
 
                     except json.JSONDecodeError:
-                        print("Content looks like JSON but failed to parse (will treat as text).")
+                        logger.warning("Content looks like JSON but failed to parse (will treat as text).")
 
 
                 # If none of the above, treat as plain text
-                print("Treating content as plain text.")
+                logger.debug("Treating content as plain text.")
                 return {
                     'title': f"Tender Text from {source}",
                     'description': content_strip[:5000], # Limit length
@@ -1474,27 +2243,27 @@ class TenderTrailIntegration:
                 # Already a dictionary, just ensure source is set
                 if 'source' not in content:
                     content['source'] = source
-                print("Content is already a dictionary.")
+                logger.debug("Content is already a dictionary.")
                 return content
 
             # --- Handle List Content ---
             elif isinstance(content, list):
-                print("Content is a list.")
+                logger.debug("Content is a list.")
                 if len(content) == 1 and isinstance(content[0], dict):
-                     print("Using first item from list as it's a dict.")
+                     logger.debug("Using first item from list as it's a dict.")
                      item_dict = content[0]
                      if 'source' not in item_dict: item_dict['source'] = source
                      return item_dict
                 elif content:
-                     print("Wrapping list content.")
+                     logger.debug("Wrapping list content.")
                      return {'title': f"List data from {source}", 'data_list': content, 'source': source, 'raw_data_type': 'list'}
                 else:
-                     print("Content is an empty list.")
+                     logger.debug("Content is an empty list.")
                      return {'title': f"Empty List from {source}", 'source': source, 'description': ''} # Return minimal valid dict
 
             # --- Handle Other Types ---
             else:
-                print(f"Content is an unsupported type: {type(content)}. Converting to string.")
+                logger.debug("Content is an unsupported type: %s. Converting to string.", type(content))
                 return {
                     'title': f"Data from {source}",
                     'description': str(content)[:5000],
@@ -1503,7 +2272,7 @@ class TenderTrailIntegration:
                 }
 
         except Exception as e:
-            print(f"Error in _extract_structured_data: {e}")
+            logger.error("Error in _extract_structured_data: %s", e)
             # Return a minimal structure indicating error
             return {
                 'title': f"Error Processing Tender from {source}",
@@ -1562,16 +2331,14 @@ class TenderTrailIntegration:
             
             return text
         except ImportError:
-            print("BeautifulSoup not available, using basic HTML cleaning")
+            logger.debug("BeautifulSoup not available, using basic HTML cleaning")
             
         # Basic fallback cleaning if BeautifulSoup is not available
-        import re
-        
         # Remove HTML tags
-        clean_text = re.sub(r'<[^>]+>', ' ', html_content)
+        clean_text = _HTML_TAG_RE.sub(' ', html_content)
         
         # Remove extra whitespace
-        clean_text = re.sub(r'\s+', ' ', clean_text).strip()
+        clean_text = _WHITESPACE_RE.sub(' ', clean_text).strip()
         
         # Replace HTML entities
         entities = {
@@ -1602,11 +2369,8 @@ class TenderTrailIntegration:
                 
             # Ensure tender is a dictionary
             if not isinstance(tender, dict):
-                print(f"Cannot normalize non-dictionary tender: {type(tender)}")
+                logger.warning("Cannot normalize non-dictionary tender: %s", type(tender))
                 return None
-                
-            # Create a copy to avoid modifying the original
-            normalized = {}
             
             # Get source name if not provided
             if not source_name:
@@ -1614,149 +2378,92 @@ class TenderTrailIntegration:
                 if not source_name:
                     source_name = "unknown"
             
-            # Add source to normalized data
-            normalized['source'] = source_name
+            # Use the normalizer specialized for this source, building it on first use
+            normalizer = self._compiled_norms.get(source_name)
+            if normalizer is None:
+                normalizer = self._compile_normalizer(source_name)
+                self._compiled_norms[source_name] = normalizer
             
-            # Map common fields
-            field_mapping = {
-                # Title
-                'title': 'notice_title',
-                'name': 'notice_title',
-                'subject': 'notice_title',
-                'noticeTitle': 'notice_title',
-                'tender_title': 'notice_title',
-                
-                # Description
-                'description': 'description',
-                'details': 'description',
-                'summary': 'description',
-                'noticeDescription': 'description',
-                'text': 'description',
-                'content': 'description',
-                'body': 'description',
-                
-                # Date Published
-                'date_published': 'date_published',
-                'datePublished': 'date_published',
-                'publicationDate': 'date_published',
-                'published': 'date_published',
-                'publishedDate': 'date_published',
-                'created_at': 'date_published',
-                'createdAt': 'date_published',
-                'publication_date': 'date_published',
-                
-                # Closing Date
-                'closing_date': 'closing_date',
-                'closeDate': 'closing_date',
-                'deadline': 'closing_date',
-                'deadlineDate': 'closing_date',
-                'submissionDeadline': 'closing_date',
-                'expiryDate': 'closing_date',
-                'expiry_date': 'closing_date',
-                'end_date': 'closing_date',
-                'endDate': 'closing_date',
-                
-                # Tender Value
-                'tender_value': 'tender_value',
-                'value': 'tender_value',
-                'amount': 'tender_value',
-                'budget': 'tender_value',
-                'estimatedValue': 'tender_value',
-                'estimated_value': 'tender_value',
-                'contractValue': 'tender_value',
-                'contract_value': 'tender_value',
-                
-                # Currency
-                'currency': 'currency',
-                'currencyCode': 'currency',
-                'currency_code': 'currency',
-                
-                # Location
-                'location': 'location',
-                'country': 'country',
-                'region': 'location',
-                'place': 'location',
-                'placeOfPerformance': 'location',
-                'place_of_performance': 'location',
-                
-                # Issuing Authority
-                'issuing_authority': 'issuing_authority',
-                'issuingAuthority': 'issuing_authority',
-                'buyer': 'issuing_authority',
-                'agency': 'issuing_authority',
-                'organization': 'issuing_authority',
-                'authority': 'issuing_authority',
-                'contractingAuthority': 'issuing_authority',
-                'contracting_authority': 'issuing_authority',
-                'procuring_entity': 'issuing_authority',
-                'procuringEntity': 'issuing_authority',
+            return normalizer(tender)
                 
-                # Tender Type
-                'tender_type': 'notice_type',
-                'type': 'notice_type',
-                'noticeType': 'notice_type',
-                'notice_type': 'notice_type',
-                'procedureType': 'notice_type',
-                'procedure_type': 'notice_type',
-                
-                # Notice ID / Reference
-                'notice_id': 'notice_id',
-                'id': 'notice_id',
-                'reference': 'notice_id',
-                'referenceNumber': 'notice_id',
-                'reference_number': 'notice_id',
-                'tenderReference': 'notice_id',
-                'tender_reference': 'notice_id',
-                
-                # URL
-                'url': 'url',
-                'link': 'url',
-                'tender_url': 'url',
-                'tenderUrl': 'url',
-                'noticeUrl': 'url',
-                'notice_url': 'url',
-                
-                # Contact Information
-                'contact': 'contact_information',
-                'contactPerson': 'contact_information',
-                'contact_person': 'contact_information',
-                'contactEmail': 'contact_email',
-                'contact_email': 'contact_email',
-                'contactPhone': 'contact_phone',
-                'contact_phone': 'contact_phone'
-            }
+        except Exception as e:
+            logger.error("Error in rule-based normalization: %s", e)
+            # Per-tender failures can be frequent; only format the traceback when debugging
+            logger.debug("Traceback for rule-based normalization failure", exc_info=True)
+            return None
+
+    def _compile_normalizer(self, source_name):
+        """
+        Build the rule-based normalizer for a single source.
+        
+        The shared field rules (_FIELD_RULES) and the source-specific fallbacks are
+        bound up front, so the returned function does no mapping construction or
+        source dispatch per tender, and only visits the fields the tender has.
+        
+        Args:
+            source_name: Name of the source the normalizer is specialized for
+            
+        Returns:
+            Function taking a tender dictionary and returning the normalized dictionary
+        """
+        field_rule = _FIELD_RULES.get
+        
+        # Source-specific fallbacks, applied only when the target is still missing
+        parse_date = self._parse_date
+        fallbacks = tuple(
+            (source_field, target_field, parse_date if transform == 'date' else transform)
+            for source_field, target_field, transform in _SOURCE_FALLBACKS.get(source_name, ())
+        )
+        
+        clean_html = self._clean_html
+        is_valid_date_format = self._is_valid_date_format
+        find_currency = _CURRENCY_RE.search
+        strip_non_numeric = _NUMERIC_STRIP_RE.sub
+        
+        if type(source_name) is str:
+            source_name = sys.intern(source_name)
+        
+        def normalize(tender):
+            normalized = {'source': source_name}
             
-            # Map fields from tender to normalized tender
-            for source_field, target_field in field_mapping.items():
-                if source_field in tender and tender[source_field] is not None:
+            # Map fields from tender to normalized tender, walking the tender's own keys
+            ranks = {}
+            for source_field, value in tender.items():
+                rule = field_rule(source_field)
+                if rule is None or value is None:
+                    continue
+                target_field, kind, rank = rule
+                if ranks.get(target_field, -1) > rank:
+                    # A field later in the mapping already supplied this target
+                    continue
+                if kind == 'text':
                     # Clean text fields
-                    if source_field in ['description', 'details', 'summary', 'text', 'content', 'body']:
-                        # Format description
-                        if isinstance(tender[source_field], str):
-                            normalized[target_field] = self._clean_html(tender[source_field])
-                    elif source_field in ['date_published', 'datePublished', 'publicationDate', 'published', 
-                                        'publishedDate', 'created_at', 'createdAt', 'publication_date',
-                                        'closing_date', 'closeDate', 'deadline', 'deadlineDate', 
-                                        'submissionDeadline', 'expiryDate', 'expiry_date', 'end_date', 'endDate']:
-                        # Parse dates
-                        date_value = self._parse_date(tender[source_field])
-                        if date_value:
-                            normalized[target_field] = date_value
-                    else:
-                        # Copy other fields directly
-                        normalized[target_field] = tender[source_field]
+                    if not isinstance(value, str):
+                        continue
+                    value = clean_html(value)
+                elif kind == 'date':
+                    # Parse dates
+                    value = parse_date(value)
+                    if not value:
+                        continue
+                # Other fields are copied directly
+                normalized[target_field] = value
+                ranks[target_field] = rank
             
             # Try to extract raw_id if not already set
-            if 'raw_id' not in normalized and 'notice_id' in normalized:
-                normalized['raw_id'] = normalized['notice_id']
-            elif 'raw_id' not in normalized and 'id' in tender:
-                normalized['raw_id'] = tender['id']
+            if 'raw_id' not in normalized:
+                raw_id = normalized.get('notice_id', _MISSING)
+                if raw_id is _MISSING:
+                    raw_id = tender.get('id', _MISSING)
+                if raw_id is not _MISSING:
+                    normalized['raw_id'] = raw_id
                 
             # Handle special case for title/name
             if 'notice_title' not in normalized:
                 for title_field in ['heading', 'header', 'noticeHeader', 'notice_header', 'label']:
-                    if title_field in tender and tender[title_field]:
-                        normalized['notice_title'] = tender[title_field]
+                    title_value = tender.get(title_field)
+                    if title_value:
+                        normalized['notice_title'] = title_value
                         break
                         
             # Generate a generic title if none exists
@@ -1765,63 +2472,51 @@ class TenderTrailIntegration:
                 
             # Normalize dates
             for date_field in ['date_published', 'closing_date']:
-                if date_field in normalized and not self._is_valid_date_format(normalized[date_field]):
-                    parsed_date = self._parse_date(normalized[date_field])
+                date_value = normalized.get(date_field)
+                if date_value is not None and not is_valid_date_format(date_value):
+                    parsed_date = parse_date(date_value)
                     if parsed_date:
                         normalized[date_field] = parsed_date
                     else:
                         normalized.pop(date_field, None)
                         
             # Extract tender value and currency if combined
-            if 'tender_value' in normalized and isinstance(normalized['tender_value'], str):
-                import re
+            value_str = normalized.get('tender_value')
+            if isinstance(value_str, str):
                 # Look for currency codes or symbols in the value
-                value_str = normalized['tender_value']
-                currency_pattern = r'([A-Z]{3}|\$|€|£|¥)'
-                matches = re.findall(currency_pattern, value_str)
-                if matches:
+                match = find_currency(value_str)
+                if match:
                     # Extract the first currency match
-                    currency = matches[0]
+                    currency = match.group(1)
                     # Convert symbols to codes
-                    currency_map = {'$': 'USD', '€': 'EUR', '£': 'GBP', '¥': 'JPY'}
-                    if currency in currency_map:
-                        currency = currency_map[currency]
-                    normalized['currency'] = currency
+                    normalized['currency'] = _CURRENCY_SYMBOLS.get(currency, currency)
                     
                     # Extract numeric value
-                    numeric_part = re.sub(r'[^\d.]', '', value_str)
+                    numeric_part = strip_non_numeric('', value_str)
                     if numeric_part:
                         normalized['tender_value'] = numeric_part.strip()
                         
             # Clean up whitespace in text fields
             for field in ['notice_title', 'description', 'issuing_authority', 'location']:
-                if field in normalized and isinstance(normalized[field], str):
-                    normalized[field] = normalized[field].strip()
-                    
-            # Source-specific normalization
-            if source_name == 'ungm':
-                # UNGM-specific field mapping
-                if 'deadline' in tender and not 'closing_date' in normalized:
-                    normalized['closing_date'] = self._parse_date(tender['deadline'])
-                if 'agency' in tender and not 'issuing_authority' in normalized:
-                    normalized['issuing_authority'] = tender['agency']
+                text = normalized.get(field)
+                if isinstance(text, str):
+                    normalized[field] = text.strip()
                     
-            elif source_name == 'ted_eu':
-                # TED EU-specific field mapping
-                if 'cpvs' in tender and not 'keywords' in normalized:
-                    normalized['keywords'] = tender['cpvs']
+            # Share one string object per value of the small-vocabulary fields
+            for field in _INTERNED_FIELDS:
+                text = normalized.get(field)
+                if type(text) is str:
+                    normalized[field] = sys.intern(text)
                     
-            elif source_name == 'wb' or source_name == 'worldbank':
-                # World Bank specific field mapping
-                if 'borrower' in tender and not 'issuing_authority' in normalized:
-                    normalized['issuing_authority'] = tender['borrower']
+            # Source-specific normalization
+            for source_field, target_field, transform in fallbacks:
+                value = tender.get(source_field, _MISSING)
+                if value is not _MISSING and target_field not in normalized:
+                    normalized[target_field] = transform(value) if transform else value
                     
             return normalized
-                
-        except Exception as e:
-            print(f"Error in rule-based normalization: {e}")
-            traceback.print_exc()
-            return None
+        
+        return normalize
 
     def _detect_potential_duplicate(self, tender, existing_tenders):
         """
@@ -1835,11 +2530,11 @@ class TenderTrailIntegration:
         Returns:
             bool: True if potential duplicate found, False otherwise
         """
-        print(f"DEBUG: Checking for duplicates for tender: {str(tender.get('notice_title', ''))[:50]}")
+        logger.debug("Checking for duplicates for tender: %s", str(tender.get('notice_title', ''))[:50])
         
         # If no title or ID, can't do duplicate detection
         if not tender.get('notice_title') and not tender.get('notice_id') and not tender.get('raw_id'):
-            print("DEBUG: Can't check for duplicates - no title or ID")
+            logger.debug("Can't check for duplicates - no title or ID")
             return False
             
         # Check by ID first
@@ -1848,7 +2543,7 @@ class TenderTrailIntegration:
             for existing in existing_tenders:
                 existing_id = existing.get('notice_id') or existing.get('raw_id')
                 if existing_id and existing_id == tender_id:
-                    print(f"DEBUG: Duplicate detected by ID: {tender_id}")
+                    logger.debug("Duplicate detected by ID: %s", tender_id)
                     return True
                     
         # Check by title if available
@@ -1874,11 +2569,11 @@ class TenderTrailIntegration:
                         
                     # If both location and date match, it's likely a duplicate
                     if location_match and date_match:
-                        print("DEBUG: Generic title but location and date match - likely duplicate")
+                        logger.debug("Generic title but location and date match - likely duplicate")
                         return True
                         
                 # Otherwise, it's probably a different tender
-                print("DEBUG: Generic title but not enough evidence for duplicate")
+                logger.debug("Generic title but not enough evidence for duplicate")
                 return False
             
             # Normal title comparison
@@ -1889,14 +2584,14 @@ class TenderTrailIntegration:
                     
                 # Exact title match
                 if title == existing_title:
-                    print(f"DEBUG: Duplicate detected by exact title match: {title[:50]}")
+                    logger.debug("Duplicate detected by exact title match: %s", title[:50])
                     return True
                     
                 # Check for significant title similarity
                 # Calculate title similarity ratio
                 similarity = self._calculate_similarity(title, existing_title)
                 if similarity > 0.85:  # High similarity threshold
-                    print(f"DEBUG: Duplicate detected by title similarity ({similarity:.2f}): {title[:50]}")
+                    logger.debug("Duplicate detected by title similarity (%.2f): %s", similarity, title[:50])
                     return True
                     
         return False
@@ -1906,12 +2601,14 @@ class TenderTrailIntegration:
         import difflib
         return difflib.SequenceMatcher(None, str1, str2).ratio()
 
-    def _validate_normalized_tender(self, tender):
+    def _validate_normalized_tender(self, tender, dates_checked=False):
         """
         Validate a normalized tender for completeness and correctness.
         
         Args:
             tender: Dictionary containing normalized tender data
+            dates_checked: Skip the date format checks when the caller has already
+                normalized date_published and closing_date
             
         Returns:
             Tuple (is_valid, message) where:
@@ -1929,14 +2626,15 @@ class TenderTrailIntegration:
                 return False, f"Missing required field: {field}"
                 
         # Check date formats if they exist
-        for date_field in ['date_published', 'closing_date']:
-            if date_field in tender and tender[date_field]:
-                if not self._is_valid_date_format(tender[date_field]):
-                    parsed_date = self._parse_date(tender[date_field])
-                    if parsed_date:
-                        tender[date_field] = parsed_date
-                    else:
-                        return False, f"Invalid date format for {date_field}: {tender[date_field]}"
+        if not dates_checked:
+            for date_field in ['date_published', 'closing_date']:
+                if date_field in tender and tender[date_field]:
+                    if not self._is_valid_date_format(tender[date_field]):
+                        parsed_date = self._parse_date(tender[date_field])
+                        if parsed_date:
+                            tender[date_field] = parsed_date
+                        else:
+                            return False, f"Invalid date format for {date_field}: {tender[date_field]}"
                         
         # Check description length if it exists
         if 'description' in tender and tender['description']:
@@ -1984,120 +2682,11 @@ class TenderTrailIntegration:
         Returns:
             A default schema for the source
         """
-        # Common field mappings for default schema
-        common_mappings = {
-            "title": {"type": "string", "maps_to": "title"},
-            "description": {"type": "string", "maps_to": "description"},
-            "notice_title": {"type": "string", "maps_to": "title"},
-            "notice_id": {"type": "string", "maps_to": "raw_id"},
-            "source": {"type": "string", "maps_to": "source"},
-            "date_published": {"type": "date", "maps_to": "date_published"},
-            "publication_date": {"type": "date", "maps_to": "date_published"},
-            "closing_date": {"type": "date", "maps_to": "closing_date"},
-            "deadline": {"type": "date", "maps_to": "closing_date"},
-            "due_date": {"type": "date", "maps_to": "closing_date"},
-            "tender_value": {"type": "monetary", "maps_to": "tender_value"},
-            "currency": {"type": "string", "maps_to": "tender_currency"},
-            "country": {"type": "string", "maps_to": "location"},
-            "location": {"type": "string", "maps_to": "location"},
-            "issuing_authority": {"type": "string", "maps_to": "issuing_authority"},
-            "notice_type": {"type": "string", "maps_to": "tender_type"},
-            "tender_type": {"type": "string", "maps_to": "tender_type"},
-            "organization": {"type": "string", "maps_to": "issuing_authority"}
-        }
-        
-        # Source-specific default schemas
-        if source_name == "adb":
-            fields = {
-                "title": common_mappings["title"],
-                "description": common_mappings["description"],
-                "published_date": {"type": "date", "maps_to": "date_published"},
-                "deadline": {"type": "date", "maps_to": "closing_date"},
-                "budget": {"type": "monetary", "maps_to": "tender_value"},
-                "location": common_mappings["location"],
-                "authority": {"type": "string", "maps_to": "issuing_authority"},
-                "notice_title": common_mappings["notice_title"],
-                "publication_date": common_mappings["publication_date"],
-                "due_date": common_mappings["due_date"]
-            }
-        elif source_name == "wb" or source_name == "worldbank":
-            fields = {
-                "title": common_mappings["title"],
-                "description": common_mappings["description"],
-                "publication_date": {"type": "date", "maps_to": "date_published"},
-                "closing_date": {"type": "date", "maps_to": "closing_date"},
-                "value": {"type": "monetary", "maps_to": "tender_value"},
-                "country": {"type": "string", "maps_to": "location"},
-                "borrower": {"type": "string", "maps_to": "issuing_authority"}
-            }
-        elif source_name == "ungm":
-            fields = {
-                "title": common_mappings["title"],
-                "description": common_mappings["description"],
-                "published": {"type": "date", "maps_to": "date_published"},
-                "deadline": {"type": "date", "maps_to": "closing_date"},
-                "value": {"type": "monetary", "maps_to": "tender_value"},
-                "country": {"type": "string", "maps_to": "location"},
-                "agency": {"type": "string", "maps_to": "issuing_authority"}
-            }
-        elif source_name == "ted_eu":
-            fields = {
-                "title": common_mappings["title"],
-                "description": common_mappings["description"],
-                "publicationDate": {"type": "date", "maps_to": "date_published"},
-                "submissionDeadline": {"type": "date", "maps_to": "closing_date"},
-                "estimatedValue": {"type": "monetary", "maps_to": "tender_value"},
-                "country": {"type": "string", "maps_to": "location"},
-                "contractingAuthority": {"type": "string", "maps_to": "issuing_authority"},
-                "procedureType": {"type": "string", "maps_to": "tender_type"},
-                "cpvCodes": {"type": "array", "maps_to": "keywords"}
-            }
-        elif source_name == "sam_gov":
-            fields = {
-                "title": common_mappings["title"],
-                "description": common_mappings["description"],
-                "posted_date": {"type": "date", "maps_to": "date_published"},
-                "response_deadline": {"type": "date", "maps_to": "closing_date"},
-                "estimated_value": {"type": "monetary", "maps_to": "tender_value"},
-                "place_of_performance": {"type": "string", "maps_to": "location"},
-                "agency": {"type": "string", "maps_to": "issuing_authority"},
-                "notice_type": {"type": "string", "maps_to": "tender_type"},
-                "solicitation_number": {"type": "string", "maps_to": "raw_id"}
-            }
-        elif source_name == "afdb":
-            fields = {
-                "title": common_mappings["title"],
-                "description": common_mappings["description"],
-                "publication_date": common_mappings["publication_date"],
-                "closing_date": common_mappings["closing_date"],
-                "estimated_value": {"type": "monetary", "maps_to": "tender_value"},
-                "currency": common_mappings["currency"],
-                "country": common_mappings["country"],
-                "tender_type": common_mappings["tender_type"],
-                "sector": {"type": "string", "maps_to": "sector"}
-            }
-        else:
-            # Generic schema for any other source
-            fields = {
-                "title": common_mappings["title"],
-                "description": common_mappings["description"],
-                "date_published": {"type": "date", "maps_to": "date_published"},
-                "publication_date": {"type": "date", "maps_to": "date_published"},
-                "closing_date": {"type": "date", "maps_to": "closing_date"},
-                "tender_value": {"type": "monetary", "maps_to": "tender_value"},
-                "location": {"type": "string", "maps_to": "location"},
-                "country": {"type": "string", "maps_to": "location"},
-                "issuing_authority": {"type": "string", "maps_to": "issuing_authority"},
-                "notice_type": {"type": "string", "maps_to": "tender_type"},
-                "tender_type": {"type": "string", "maps_to": "tender_type"},
-                "notice_id": {"type": "string", "maps_to": "raw_id"}
-            }
-        
-        # Return schema with proper structure
-        schema = {
+        # Return schema with proper structure; the fields are copied so callers can
+        # adjust them without touching the defaults shared by every source
+        fields = _DEFAULT_SOURCE_FIELDS.get(source_name, _GENERIC_SOURCE_FIELDS)
+        return {
             "source_name": source_name or "generic",
             "language": "en",
-            "fields": fields
+            "fields": {field: dict(spec) for field, spec in fields.items()}
         }
-        
-        return schema
@@ -1,7 +1,11 @@
 import os
+import sys
 import json
+import types
+import asyncio
 import unittest
-from tendertrail_integration import TenderTrailIntegration
+from unittest.mock import AsyncMock, patch
+from tendertrail_integration import TenderTrailIntegration, _pack_translation_requests, _translate_joined
 
 # Mock Supabase client for testing
 class MockSupabase:
@@ -32,6 +36,7 @@ class MockTable:
     def __init__(self, name):
         self.name = name
         self.data = []
+        self.upserts = []
     
     def select(self, fields):
         return self
@@ -43,14 +48,38 @@ class MockTable:
     def limit(self, n):
         return self
     
+    def upsert(self, records, **kwargs):
+        self.upserts.append((records, kwargs))
+        return MockUpsert(records)
+    
     def execute(self):
         return MockResponse(data=self.data)
 
+class MockUpsert:
+    def __init__(self, records):
+        self.records = records
+    
+    def execute(self):
+        return MockResponse(data=self.records)
+
 class MockResponse:
     def __init__(self, data=None, error=None):
         self.data = data or []
         self.error = error
 
+class MockTranslator:
+    """Upper-cases text, optionally dropping the '|||' separators of packed requests."""
+    def __init__(self, drop_separator=False):
+        self.drop_separator = drop_separator
+        self.requests = []
+    
+    def translate(self, text):
+        self.requests.append(text)
+        translated = text.upper()
+        if self.drop_separator:
+            translated = translated.replace("|||", "")
+        return translated
+
 # Mock normalizer and preprocessor for testing
 class MockNormalizer:
     def normalize_tender(self, tender):
@@ -140,6 +169,40 @@ class TestTenderTrailIntegration(unittest.TestCase):
             parsed = self.integration._parse_date(input_date)
             self.assertEqual(parsed, expected, f"Failed parsing {input_date}")
     
+    def test_date_parsing_matches_dateutil_cascade(self):
+        """Test that the strptime shortcuts parse each input shape as the dateutil cascade does."""
+        test_dates = {
+            # Slashed
+            "2024/05/15": "2024-05-15",
+            "2024/5/3": "2024-05-03",
+            " 2024/05/15": "2024-05-15",
+            "03/04/2024": "2024-03-04",  # Ambiguous: month first, as dateutil reads it
+            # Dotted
+            "2024.05.15": "2024-05-15",
+            "2024.5.3": "2024-05-03",
+            "03.04.2024": "2024-03-04",
+            # Day first
+            "15 May 2024": "2024-05-15",
+            "3 December 2024": "2024-12-03",
+            "15 sept 2024": "2024-09-15",
+            "03-04-2024": "2024-03-04",
+            # Month first
+            "May 15, 2024": "2024-05-15",
+            "December 3, 2024": "2024-12-03",
+            "Sept 5, 2024": "2024-09-05",
+            "dec 3, 2024": "2024-12-03",
+            "May 15 2024": "2024-05-15",
+            # ISO week dates are not parsed
+            "2023-W02": None,
+            "2023-W02-1": None,
+            "2023W02": None,
+            "2024-W20-1": None,
+        }
+        
+        for input_date, expected in test_dates.items():
+            with self.subTest(input_date=input_date):
+                self.assertEqual(self.integration._parse_date(input_date), expected)
+    
     def test_value_parsing(self):
         """Test value extraction and cleaning for tender_value field."""
         # Create a test method to simulate the value parsing part of _insert_normalized_tenders
@@ -231,5 +294,137 @@ class TestTenderTrailIntegration(unittest.TestCase):
         self.assertTrue(isinstance(validated["tag"], list))
         self.assertEqual(validated["cpvs"], ["Single CPV"])
 
+    def test_upsert_without_rows_is_queued_as_error(self):
+        """Test that an upsert reporting no rows counts nothing and queues an error record."""
+        self.supabase.table('unified_tenders').upsert = lambda records, **kwargs: MockUpsert([])
+        self.integration._queue_error = AsyncMock()
+        
+        inserted, duplicates = asyncio.run(self.integration._insert_normalized_tenders(
+            [{"notice_id": "E-1", "notice_title": "Lost tender", "source": "afd"}], create_tables=False))
+        
+        self.assertEqual((inserted, duplicates), (0, 0))
+        error = self.integration._queue_error.call_args.args[0]
+        self.assertEqual(error["context"], "Batch upsert failure")
+        self.assertEqual(json.loads(error["tender_data"])["raw_ids"], ["E-1"])
+
+    def test_default_target_schema_is_not_shared(self):
+        """Test that changes to the returned default target schema don't leak into later calls."""
+        target_schema = self.integration._get_default_target_schema()
+        target_schema["title"]["format"] = "Changed"
+        target_schema["extra"] = {"type": "string"}
+        self.assertNotEqual(self.integration._get_default_target_schema()["title"]["format"], "Changed")
+        self.assertNotIn("extra", self.integration._get_default_target_schema())
+
+    def _upserted_rows(self, tenders):
+        """Run tenders through the insert path and return the rows sent to unified_tenders."""
+        asyncio.run(self.integration._insert_normalized_tenders(tenders, create_tables=False))
+        table = self.supabase.tables['unified_tenders']
+        return [row for records, _kwargs in table.upserts for row in records]
+
+    def test_duplicate_tenders_keep_last_and_are_not_errors(self):
+        """Test that the last tender per (source, raw_id) is stored and duplicates don't count as errors."""
+        normalized = [
+            {"notice_id": "D-1", "notice_title": "Original title", "source": "afd"},
+            {"notice_id": "D-2", "notice_title": "Other tender", "source": "afd"},
+            {"notice_id": "D-1", "notice_title": "Corrected title", "source": "afd"},
+        ]
+        self.integration._enhanced_process_raw_tenders = AsyncMock(return_value=normalized)
+        
+        processed, errors = asyncio.run(self.integration.process_source(normalized, "afd", create_tables=False))
+        
+        rows = [row for records, _kwargs in self.supabase.tables['unified_tenders'].upserts for row in records]
+        titles = {row["raw_id"]: row["title"] for row in rows}
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(titles["D-1"], "Corrected title")
+        self.assertEqual(processed, 3)
+        self.assertEqual(errors, 0)
+
+    def test_duplicate_across_batches_keeps_last(self):
+        """Test that a tender repeated in a later batch is upserted after the earlier one."""
+        import tendertrail_integration
+        original_batch_size = tendertrail_integration.UPSERT_BATCH_SIZE
+        tendertrail_integration.UPSERT_BATCH_SIZE = 2
+        try:
+            rows = self._upserted_rows([
+                {"notice_id": "B-1", "notice_title": "Original title", "source": "afd"},
+                {"notice_id": "B-2", "notice_title": "Other tender", "source": "afd"},
+                {"notice_id": "B-1", "notice_title": "Corrected title", "source": "afd"},
+            ])
+        finally:
+            tendertrail_integration.UPSERT_BATCH_SIZE = original_batch_size
+        
+        self.assertEqual([row["title"] for row in rows if row["raw_id"] == "B-1"],
+                         ["Original title", "Corrected title"])
+
+    def test_metadata_is_coerced_per_row(self):
+        """Test that metadata JSON can't represent is coerced per row instead of failing the batch."""
+        import datetime
+        from decimal import Decimal
+        rows = self._upserted_rows([
+            {"notice_id": "M-1", "notice_title": "Nested values", "source": "afd",
+             "metadata": {"published": {"at": datetime.datetime(2024, 5, 15, 9, 30)}, "values": [Decimal("1.5")]}},
+            {"notice_id": "M-2", "notice_title": "Unusable keys", "source": "afd",
+             "metadata": {("lot", 1): "first lot"}},
+            {"notice_id": "M-3", "notice_title": "Plain values", "source": "afd",
+             "metadata": {"lots": 2}},
+        ])
+        
+        self.assertEqual(len(rows), 3)
+        metadata = {row["raw_id"]: row["metadata"] for row in rows}
+        self.assertEqual(metadata["M-1"], {"published": {"at": "2024-05-15T09:30:00"}, "values": ["1.5"]})
+        self.assertIsInstance(metadata["M-2"], str)
+        self.assertEqual(metadata["M-3"], {"lots": 2})
+        # The whole batch must serialize as the request body
+        json.dumps(rows)
+
+    def test_default_source_schema_is_not_shared(self):
+        """Test that changes to a returned default source schema don't leak into other sources."""
+        source_schema = self.integration._get_default_source_schema("afd")
+        source_schema["fields"]["title"]["maps_to"] = "description"
+        source_schema["fields"]["extra"] = {"type": "string", "maps_to": "extra"}
+        for source_name in ("afd", "ungm", None):
+            fields = self.integration._get_default_source_schema(source_name)["fields"]
+            self.assertEqual(fields["title"]["maps_to"], "title")
+            self.assertNotIn("extra", fields)
+
+    def test_translated_text_is_stored(self):
+        """Test that non-ASCII text is stored as its translation and ASCII text as-is."""
+        translator_module = types.SimpleNamespace(GoogleTranslator=lambda **options: MockTranslator())
+        with patch.dict(sys.modules, {"deep_translator": translator_module}):
+            rows = self._upserted_rows([
+                {"notice_id": "T-1", "notice_title": "Construction d'une école",
+                 "description": "Primary school building", "source": "afd"},
+            ])
+
+        self.assertEqual(rows[0]["title"], "CONSTRUCTION D'UNE ÉCOLE")
+        self.assertEqual(rows[0]["description"], "Primary school building")
+
+    def test_packed_translation(self):
+        """Test that packed translations split back onto their own texts."""
+        texts = ["école primaire", "réseau d'eau", "bâtiment"]
+        translator = MockTranslator()
+        
+        self.assertEqual(_translate_joined(translator, texts), ["ÉCOLE PRIMAIRE", "RÉSEAU D'EAU", "BÂTIMENT"])
+        self.assertEqual(len(translator.requests), 1)
+    
+    def test_packed_translation_mismatch_falls_back_per_text(self):
+        """Test that a packed translation which doesn't split back is redone text by text."""
+        texts = ["école primaire", "réseau d'eau", "bâtiment"]
+        translator = MockTranslator(drop_separator=True)
+        
+        self.assertEqual(_translate_joined(translator, texts), ["ÉCOLE PRIMAIRE", "RÉSEAU D'EAU", "BÂTIMENT"])
+        self.assertEqual(translator.requests[1:], texts)
+        
+        # The same through the batch prefetch: every text is cached with its own translation
+        tenders = [{"notice_title": text} for text in texts]
+        asyncio.run(self.integration._prefetch_translations(MockTranslator(drop_separator=True), tenders))
+        self.assertEqual(dict(self.integration.translation_cache),
+                         {"école primaire": "ÉCOLE PRIMAIRE", "réseau d'eau": "RÉSEAU D'EAU", "bâtiment": "BÂTIMENT"})
+    
+    def test_texts_containing_separator_are_not_packed(self):
+        """Test that a text containing the packing separator is left to a single request."""
+        requests = _pack_translation_requests(["lot 1 ||| lot 2", "école", "bâtiment"])
+        self.assertEqual(requests, [["école", "bâtiment"]])
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file